@@ -35,6 +35,8 @@ SINK: str = "sink"
 # Item stage ordering
 # ---------------------------------------------------------------------------
 ITEM_STAGE_ORDER: list[str] = ["raw", "processed", "baked"]
+# Stage name → index into ITEM_STAGE_ORDER; unknown stages map to len(ITEM_STAGE_ORDER).
+ITEM_STAGE_IDS: dict[str, int] = {stage: idx for idx, stage in enumerate(ITEM_STAGE_ORDER)}
 
 # ---------------------------------------------------------------------------
 # Directional movement vectors (rotation index → (dx, dy))
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from config import ITEM_STAGE_IDS, ITEM_STAGE_ORDER
 
-@dataclass
+
+@dataclass(slots=True)
 class Tile:
     """A single cell on the factory grid."""
 
@@ -13,7 +15,7 @@ class Tile:
     hygiene_penalty: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """An ingredient/food item travelling through the factory.
 
@@ -32,8 +34,13 @@ class Item:
     ingredient_type: str = ""
     recipe_key: str = ""
 
+    @property
+    def stage_id(self) -> int:
+        """Integer index of ``stage`` in ``ITEM_STAGE_ORDER`` (its length if unknown)."""
+        return ITEM_STAGE_IDS.get(self.stage, len(ITEM_STAGE_ORDER))
+
 
-@dataclass
+@dataclass(slots=True)
 class Delivery:
     """An in-flight delivery travelling to a customer."""
 
@@ -48,7 +55,7 @@ class Delivery:
     channel_key: str = "delivery"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """A customer order waiting to be fulfilled."""
 
@@ -7,9 +7,15 @@ from __future__ import annotations
 
 import json
 import random
-from dataclasses import asdict
+from heapq import heapify, heapreplace
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 from config import (
     ASSEMBLY_TABLE,
@@ -76,9 +82,39 @@ RECIPES_FILE = Path("data/recipes.json")
 RECIPES = load_recipe_catalog(RECIPES_FILE)
 ORDER_CHANNELS_FILE = Path("data/order_channels.json")
 ORDER_CHANNELS = load_order_channel_catalog(ORDER_CHANNELS_FILE)
+ORDER_CHANNEL_DISPLAY_NAMES = {channel: channel.replace("_", "-").title() for channel in ORDER_CHANNELS}
 COMMERCIALS_FILE = Path("data/commercials.json")
 COMMERCIALS = load_commercial_catalog(COMMERCIALS_FILE)
 RESEARCH = load_research_catalog()
+# Per unlocked tier (expansion_level - 1): the (key, required research) of every recipe
+# available at that tier, in catalog order. The last entry covers all higher tiers.
+RECIPES_BY_LEVEL: Tuple[Tuple[Tuple[str, str], ...], ...] = tuple(
+    tuple(
+        (key, str(recipe.get("required_research", "")).strip())
+        for key, recipe in RECIPES.items()
+        if recipe.get("unlock_tier", 0) <= level
+    )
+    for level in range(max((int(r.get("unlock_tier", 0)) for r in RECIPES.values()), default=0) + 1)
+)
+RECIPE_DIFFICULTY = {key: int(recipe.get("difficulty", 1)) for key, recipe in RECIPES.items()}
+# Prerequisite tech ids per research entry, resolved once from the catalog.
+TECH_PREREQUISITES: Dict[str, Tuple[str, ...]] = {
+    tech: tuple(str(prereq) for prereq in RESEARCH.get(tech, {}).get("prerequisites", []))
+    for tech in (*RESEARCH, *TECH_UNLOCK_COSTS)
+}
+# PROCESS_FLOW unpacked per tile kind into (from stage, to stage, research gain, delivery
+# boost or None), so an item's stage step reads a tuple instead of several dict keys.
+FLOW_STEPS: Dict[str, Tuple[str, str, float, float | None]] = {
+    kind: (flow["from"], flow["to"], float(flow["research_gain"]), flow.get("delivery_boost"))
+    for kind, flow in PROCESS_FLOW.items()
+}
+# Spawnable ingredient types and their cumulative weights, for rng.choices().
+INGREDIENT_SPAWN_TYPES = tuple(INGREDIENT_SPAWN_WEIGHTS)
+INGREDIENT_SPAWN_CUM_WEIGHTS = tuple(accumulate(INGREDIENT_SPAWN_WEIGHTS[t] for t in INGREDIENT_SPAWN_TYPES))
+# Tile kinds an item advances through (and leaves along the tile's rotation).
+FLOW_KINDS = frozenset((CONVEYOR, SOURCE, MACHINE, PROCESSOR, OVEN, BOT_DOCK, ASSEMBLY_TABLE))
+# DIRS as a tuple indexed by rot % 4, for the per-item step in tick().
+DIR_STEPS = tuple(DIRS[rot] for rot in range(4))
 
 
 def clamp(v: float, lo: float, hi: float) -> float:
@@ -116,6 +152,13 @@ class FactorySim:
         self.total_revenue: int = 0
         self.total_spend: int = 0
         self.event_log: List[str] = []
+        # Bumped whenever something the UI renders changes, so a frontend can
+        # skip redrawing frames where nothing visible happened.
+        self.frame_id: int = 0
+        # Bumped on every research unlock so UI caches of unlock-dependent data can refresh.
+        self.unlocks_version: int = 0
+        # Bumped on every grid edit (even inside a batch) so UI caches of the built tiles can refresh.
+        self.grid_version: int = 0
         self.last_hygiene_event: float = 0.0
         self.reputation: float = REPUTATION_STARTING
         self.order_channel: str = "delivery" if "delivery" in ORDER_CHANNELS else next(iter(ORDER_CHANNELS))
@@ -126,6 +169,17 @@ class FactorySim:
             key: {"completed": 0, "ontime": 0, "late": 0, "missed": 0, "revenue": 0}
             for key in ORDER_CHANNELS
         }
+        # (y, x) of every non-empty tile, so renderers can skip the empty floor.
+        self._non_empty: set[Tuple[int, int]] = set()
+        # Row-major (x, y) view of _non_empty; dropped whenever the grid changes.
+        self._non_empty_sorted: List[Tuple[int, int]] | None = None
+        # Number of BOT_DOCK tiles, recounted from _non_empty after a grid change.
+        self._dock_count: int | None = None
+        # Cumulative recipe weights for order rolls, keyed by (channel, strategy, pool).
+        self._order_weights_cache: Dict[Tuple[str, str, Tuple[str, ...]], List[float]] = {}
+        # Open begin_batch() brackets; grid edits inside one only flag a change.
+        self._batch_depth: int = 0
+        self._batch_changed: bool = False
         self._log_event("Factory initialized")
 
         self.place_static_world()
@@ -142,6 +196,27 @@ class FactorySim:
         self.grid[7][7] = Tile(PROCESSOR, rot=0)
         self.grid[7][12] = Tile(OVEN, rot=0)
         self.grid[6][12] = Tile(BOT_DOCK, rot=1)
+        self._reindex_cells()
+
+    def _reindex_cells(self) -> None:
+        self._non_empty = {
+            (y, x) for y, row in enumerate(self.grid) for x, tile in enumerate(row) if tile.kind != EMPTY
+        }
+        self._non_empty_sorted = None
+        self._dock_count = None
+        self.grid_version += 1
+
+    def non_empty_cells(self) -> List[Tuple[int, int]]:
+        """Return ``(x, y)`` for every non-empty tile in row-major order."""
+        if self._non_empty_sorted is None:
+            self._non_empty_sorted = [(x, y) for y, x in sorted(self._non_empty)]
+        return list(self._non_empty_sorted)
+
+    def _bot_dock_count(self) -> int:
+        if self._dock_count is None:
+            grid = self.grid
+            self._dock_count = sum(1 for y, x in self._non_empty if grid[y][x].kind == BOT_DOCK)
+        return self._dock_count
 
     # ------------------------------------------------------------------
     # Serialisation
@@ -149,10 +224,45 @@ class FactorySim:
 
     def to_dict(self) -> Dict:
         return {
-            "grid": [[asdict(tile) for tile in row] for row in self.grid],
-            "items": [asdict(i) for i in self.items],
-            "deliveries": [asdict(d) for d in self.deliveries],
-            "orders": [asdict(o) for o in self.orders],
+            # Tiles are stored as compact [kind, rot, hygiene_penalty] triples.
+            "grid": [[(tile.kind, tile.rot, tile.hygiene_penalty) for tile in row] for row in self.grid],
+            # Built field by field; asdict() recurses and deep-copies every value.
+            "items": [
+                {
+                    "x": i.x,
+                    "y": i.y,
+                    "progress": i.progress,
+                    "stage": i.stage,
+                    "delivery_boost": i.delivery_boost,
+                    "ingredient_type": i.ingredient_type,
+                    "recipe_key": i.recipe_key,
+                }
+                for i in self.items
+            ],
+            "deliveries": [
+                {
+                    "mode": d.mode,
+                    "remaining": d.remaining,
+                    "sla": d.sla,
+                    "duration": d.duration,
+                    "recipe_key": d.recipe_key,
+                    "reward": d.reward,
+                    "elapsed": d.elapsed,
+                    "late_reward_multiplier": d.late_reward_multiplier,
+                    "channel_key": d.channel_key,
+                }
+                for d in self.deliveries
+            ],
+            "orders": [
+                {
+                    "recipe_key": o.recipe_key,
+                    "remaining_sla": o.remaining_sla,
+                    "total_sla": o.total_sla,
+                    "reward": o.reward,
+                    "channel_key": o.channel_key,
+                }
+                for o in self.orders
+            ],
             "time": self.time,
             "spawn_timer": self.spawn_timer,
             "order_spawn_timer": self.order_spawn_timer,
@@ -192,7 +302,13 @@ class FactorySim:
             for row in raw_grid:
                 tile_row: List[Tile] = []
                 for raw_tile in row:
-                    if isinstance(raw_tile, dict):
+                    if isinstance(raw_tile, (list, tuple)) and len(raw_tile) == 3:
+                        try:
+                            tile_row.append(Tile(str(raw_tile[0]), int(raw_tile[1]), int(raw_tile[2])))
+                        except (TypeError, ValueError):
+                            tile_row.append(Tile())
+                    # Older saves store each tile as a {"kind", "rot", "hygiene_penalty"} dict.
+                    elif isinstance(raw_tile, dict):
                         try:
                             tile_row.append(
                                 Tile(
@@ -206,6 +322,7 @@ class FactorySim:
                     else:
                         tile_row.append(Tile())
                 sim.grid.append(tile_row)
+            sim._reindex_cells()
 
         sim.items = []
         for raw_item in data.get("items", []):
@@ -279,7 +396,7 @@ class FactorySim:
         rows: List[str] = []
         for channel in ORDER_CHANNELS:
             stats = self.channel_stats.get(channel, {})
-            label = channel.replace("_", "-").title()
+            label = ORDER_CHANNEL_DISPLAY_NAMES[channel]
             rows.append(
                 f"{label}: done {int(stats.get('completed', 0))} "
                 f"(on-time {int(stats.get('ontime', 0))}, late {int(stats.get('late', 0))}, "
@@ -290,6 +407,7 @@ class FactorySim:
     def _log_event(self, message: str) -> None:
         self.event_log.append(message)
         self.event_log = self.event_log[-12:]
+        self.frame_id += 1
 
     def order_channel_is_unlocked(self, channel: str) -> bool:
         if channel not in ORDER_CHANNELS:
@@ -378,8 +496,8 @@ class FactorySim:
         return self.research_focus
 
     def _research_prerequisites_met(self, tech: str) -> bool:
-        prerequisites = RESEARCH.get(tech, {}).get("prerequisites", [])
-        return all(self.tech_tree.get(str(prereq), False) for prereq in prerequisites)
+        tech_tree = self.tech_tree
+        return all(tech_tree.get(prereq, False) for prereq in TECH_PREREQUISITES.get(tech, ()))
 
     def try_unlock_research_focus(self) -> bool:
         if self.research_focus and not self.tech_tree.get(self.research_focus, False):
@@ -388,6 +506,7 @@ class FactorySim:
             focus_cost = TECH_UNLOCK_COSTS.get(self.research_focus, float("inf"))
             if self.research_points >= focus_cost:
                 self.tech_tree[self.research_focus] = True
+                self.unlocks_version += 1
                 self._log_event(f"Research unlocked: {self.research_focus}")
                 self.research_focus = ""
                 return True
@@ -459,11 +578,15 @@ class FactorySim:
     # ------------------------------------------------------------------
 
     def save(self, path: Path = SAVE_FILE) -> None:
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.to_dict()))
+        else:
+            path.write_text(json.dumps(self.to_dict(), separators=(",", ":")))
 
     @classmethod
     def load(cls, path: Path = SAVE_FILE) -> "FactorySim":
-        return cls.from_dict(json.loads(path.read_text()))
+        raw = path.read_bytes()
+        return cls.from_dict(orjson.loads(raw) if orjson is not None else json.loads(raw))
 
     # ------------------------------------------------------------------
     # Building
@@ -485,6 +608,8 @@ class FactorySim:
             return
         if kind == EMPTY:
             self.grid[y][x] = Tile()
+            self._non_empty.discard((y, x))
+            self._mark_grid_changed()
             return
         # Only charge for building on empty ground; replacing an existing tile is free
         if self.grid[y][x].kind == EMPTY:
@@ -494,6 +619,69 @@ class FactorySim:
             self.money -= cost
             self.total_spend += cost
         self.grid[y][x] = Tile(kind=kind, rot=rot % 4)
+        self._non_empty.add((y, x))
+        self._mark_grid_changed()
+
+    def place_tile_batch(self, cells: Iterable[Tuple[int, int]], kind: str, rot: int) -> int:
+        """Place ``kind`` on every (x, y) in ``cells``; return how many were placed.
+
+        Same rules as :meth:`place_tile` applied cell by cell in order, but the
+        per-kind checks and attribute lookups are hoisted out of the loop and
+        ``frame_id`` is bumped once for the whole stroke.
+        """
+        grid = self.grid
+        non_empty = self._non_empty
+        if kind == OVEN and not self.tech_tree.get("ovens", False):
+            return 0
+        if kind == BOT_DOCK and not self.tech_tree.get("bots", False):
+            return 0
+        clearing = kind == EMPTY
+        cost = MACHINE_BUILD_COSTS.get(kind, 0)
+        rot %= 4
+        placed = 0
+        for x, y in cells:
+            if not (0 <= x < GRID_W and 0 <= y < GRID_H):
+                continue
+            current = grid[y][x].kind
+            if current in (SOURCE, SINK):
+                continue
+            if clearing:
+                grid[y][x] = Tile()
+                non_empty.discard((y, x))
+            else:
+                if current == EMPTY:
+                    if self.money < cost:
+                        continue
+                    self.money -= cost
+                    self.total_spend += cost
+                grid[y][x] = Tile(kind=kind, rot=rot)
+                non_empty.add((y, x))
+            placed += 1
+        if placed:
+            self._mark_grid_changed()
+        return placed
+
+    def begin_batch(self) -> None:
+        """Start a group of grid edits (e.g. one drag stroke) that signals a single change."""
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Close a :meth:`begin_batch` bracket, bumping ``frame_id`` once if anything changed."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_changed:
+            self._batch_changed = False
+            self.frame_id += 1
+
+    def _mark_grid_changed(self) -> None:
+        self._non_empty_sorted = None
+        self._dock_count = None
+        self.grid_version += 1
+        if self._batch_depth:
+            self._batch_changed = True
+        else:
+            self.frame_id += 1
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -504,16 +692,21 @@ class FactorySim:
             self.try_unlock_research_focus()
             return
 
-        tech_state_at_tick_start = dict(self.tech_tree)
-        for tech, cost in TECH_UNLOCK_COSTS.items():
-            if tech_state_at_tick_start.get(tech, False):
-                continue
-            prerequisites = RESEARCH.get(tech, {}).get("prerequisites", [])
-            if not all(tech_state_at_tick_start.get(str(prereq), False) for prereq in prerequisites):
-                continue
-            if self.research_points >= cost:
-                self.tech_tree[tech] = True
-                self._log_event(f"Research auto-unlocked: {tech}")
+        # Prerequisites are judged against the tree as it was at the start of the pass,
+        # so unlocks are collected first and applied afterwards.
+        tech_tree = self.tech_tree
+        points = self.research_points
+        unlocked = [
+            tech
+            for tech, cost in TECH_UNLOCK_COSTS.items()
+            if points >= cost
+            and not tech_tree.get(tech, False)
+            and all(tech_tree.get(prereq, False) for prereq in TECH_PREREQUISITES.get(tech, ()))
+        ]
+        for tech in unlocked:
+            tech_tree[tech] = True
+            self.unlocks_version += 1
+            self._log_event(f"Research auto-unlocked: {tech}")
 
     @staticmethod
     def _recipe_required_products(recipe: Dict) -> set[str]:
@@ -540,26 +733,17 @@ class FactorySim:
         return x + dx, y + dy
 
     def _available_recipes(self, *, channel_key: str | None = None) -> List[str]:
-        available = [
-            key
-            for key, recipe in RECIPES.items()
-            if recipe.get("unlock_tier", 0) <= (self.expansion_level - 1)
-            and (
-                not str(recipe.get("required_research", "")).strip()
-                or self.tech_tree.get(str(recipe.get("required_research", "")).strip(), False)
-            )
-        ]
+        tier = self.expansion_level - 1
+        candidates = RECIPES_BY_LEVEL[min(tier, len(RECIPES_BY_LEVEL) - 1)] if tier >= 0 else ()
+        tech_tree = self.tech_tree
+        available = [key for key, research in candidates if not research or tech_tree.get(research, False)]
         if not channel_key:
             return available
 
         channel_cfg = ORDER_CHANNELS.get(channel_key, {})
         min_difficulty = int(channel_cfg.get("min_recipe_difficulty", 1))
         max_difficulty = int(channel_cfg.get("max_recipe_difficulty", 5))
-        filtered = [
-            key
-            for key in available
-            if min_difficulty <= int(RECIPES[key].get("difficulty", 1)) <= max_difficulty
-        ]
+        filtered = [key for key in available if min_difficulty <= RECIPE_DIFFICULTY[key] <= max_difficulty]
         return filtered if filtered else available
 
     def _spawn_order(self) -> None:
@@ -587,15 +771,22 @@ class FactorySim:
             return None
 
         commercial_cfg = COMMERCIALS.get(self.commercial_strategy, {})
-        demand_multiplier = max(0.1, float(commercial_cfg.get("demand_multiplier", 1.0)))
         reward_bonus = max(0.1, float(commercial_cfg.get("reward_multiplier", 1.0)))
         channel_cfg = ORDER_CHANNELS.get(channel_key, {})
-        channel_demand_weight = max(0.01, float(channel_cfg.get("demand_weight", 1.0)))
-        weights = [
-            max(0.01, float(RECIPES[key].get("demand_weight", 1.0)) * channel_demand_weight * demand_multiplier)
-            for key in available
-        ]
-        key = self.rng.choices(available, weights=weights, k=1)[0]
+        # The weights only depend on the catalogs, so the cumulative table is built
+        # once per (channel, strategy, pool); choices() then skips the accumulate.
+        weights_key = (channel_key, self.commercial_strategy, tuple(available))
+        cum_weights = self._order_weights_cache.get(weights_key)
+        if cum_weights is None:
+            demand_multiplier = max(0.1, float(commercial_cfg.get("demand_multiplier", 1.0)))
+            channel_demand_weight = max(0.01, float(channel_cfg.get("demand_weight", 1.0)))
+            weights = [
+                max(0.01, float(RECIPES[key].get("demand_weight", 1.0)) * channel_demand_weight * demand_multiplier)
+                for key in available
+            ]
+            cum_weights = list(accumulate(weights))
+            self._order_weights_cache[weights_key] = cum_weights
+        key = self.rng.choices(available, cum_weights=cum_weights, k=1)[0]
         recipe = RECIPES[key]
         sla_multiplier = max(0.1, float(channel_cfg.get("sla_multiplier", 1.0)))
         reward_multiplier = max(0.1, float(channel_cfg.get("reward_multiplier", 1.0)))
@@ -647,9 +838,7 @@ class FactorySim:
 
     def _spawn_item(self) -> None:
         """Spawn a new ingredient item at the source tile with a weighted random type."""
-        all_types = list(INGREDIENT_SPAWN_WEIGHTS.keys())
-        weights = [INGREDIENT_SPAWN_WEIGHTS[t] for t in all_types]
-        ingredient_type = self.rng.choices(all_types, weights=weights, k=1)[0]
+        ingredient_type = self.rng.choices(INGREDIENT_SPAWN_TYPES, cum_weights=INGREDIENT_SPAWN_CUM_WEIGHTS, k=1)[0]
         ingredient_cost = max(1, int(INGREDIENT_PURCHASE_COSTS.get(ingredient_type, 1)))
         if self.money < ingredient_cost:
             return
@@ -719,14 +908,53 @@ class FactorySim:
     # Main tick
     # ------------------------------------------------------------------
 
+    def _render_state(self) -> tuple:
+        """Snapshot of the scalar state the UI displays, used to bump ``frame_id``."""
+        return (
+            self.money,
+            self.total_revenue,
+            len(self.orders),
+            len(self.deliveries),
+            self.completed,
+            self.ontime,
+            round(self.hygiene, 1),
+            round(self.bottleneck, 1),
+        )
+
     def tick(self, dt: float) -> None:
+        render_state = self._render_state()
+        if self._step(dt) or render_state != self._render_state():
+            self.frame_id += 1
+
+    def tick_n(self, n: int, dt: float) -> None:
+        """Run ``n`` ticks of ``dt`` back to back.
+
+        Equivalent to calling :meth:`tick` ``n`` times, except that the render
+        snapshot is taken once around the whole run, so the ticks add at most
+        one ``frame_id`` bump between them (logged events still bump it as they
+        happen). Meant for headless runs that only look at the end state.
+        """
+        render_state = self._render_state()
+        step = self._step
+        changed = False
+        for _ in range(n):
+            if step(dt):
+                changed = True
+        if changed or render_state != self._render_state():
+            self.frame_id += 1
+
+    def _step(self, dt: float) -> bool:
+        """Advance the simulation by ``dt``; return True if any item was added, moved, changed or removed."""
+        # Research can unlock mid-tick, so this aliases the live dict rather than copying flags.
+        tech_tree = self.tech_tree
+        item_count = len(self.items)
         self.time += dt
         self.spawn_timer += dt
         self.order_spawn_timer += dt
 
         effective_spawn_interval = (
             ITEM_SPAWN_INTERVAL / DOUBLE_SPAWN_INTERVAL_DIVISOR
-            if self.tech_tree.get("double_spawn", False)
+            if tech_tree.get("double_spawn", False)
             else ITEM_SPAWN_INTERVAL
         )
         self._ensure_active_commercial_strategy_is_unlocked()
@@ -735,7 +963,7 @@ class FactorySim:
         channel_cfg = ORDER_CHANNELS.get(self.order_channel, {})
         channel_spawn_multiplier = max(0.1, float(channel_cfg.get("spawn_interval_multiplier", 1.0)))
         effective_order_spawn_interval = (ORDER_SPAWN_INTERVAL * channel_spawn_multiplier) / demand_multiplier
-        if self.tech_tree.get("second_location", False):
+        if tech_tree.get("second_location", False):
             effective_order_spawn_interval *= SECOND_LOCATION_SPAWN_INTERVAL_MULTIPLIER
         if self.spawn_timer >= effective_spawn_interval:
             self.spawn_timer = 0.0
@@ -758,7 +986,7 @@ class FactorySim:
 
         # Hygiene fluctuation
         hygiene_recovery = HYGIENE_RECOVERY_RATE + (
-            HYGIENE_TRAINING_RECOVERY_BONUS if self.tech_tree.get("hygiene_training", False) else 0.0
+            HYGIENE_TRAINING_RECOVERY_BONUS if tech_tree.get("hygiene_training", False) else 0.0
         )
         if self.time - self.last_hygiene_event > HYGIENE_EVENT_COOLDOWN and self.rng.random() < HYGIENE_EVENT_CHANCE:
             self.last_hygiene_event = self.time
@@ -767,51 +995,75 @@ class FactorySim:
             self.hygiene = clamp(self.hygiene + dt * hygiene_recovery, 0, 100)
 
         blocked = 0
+        items_changed = len(self.items) != item_count
         moved_items: List[Item] = []
-        turbo = TURBO_BELT_BONUS if self.tech_tree.get("turbo_belts", False) else 0.0
+        turbo = TURBO_BELT_BONUS if tech_tree.get("turbo_belts", False) else 0.0
+        # Tile speeds only depend on hygiene and research, so resolve them once per tick.
+        belt_speed = 1.0 + turbo
+        machine_speed = 0.5 + (self.hygiene / 220.0)
+        oven_bonus = TURBO_OVEN_SPEED_BONUS if tech_tree.get("turbo_oven", False) else 0.0
+        speed_by_kind = {
+            MACHINE: machine_speed,
+            PROCESSOR: machine_speed,
+            OVEN: 0.35 + oven_bonus + (self.hygiene / 280.0),
+            ASSEMBLY_TABLE: ASSEMBLY_TABLE_SPEED,
+        }
+        rp_multiplier = (
+            1.0 + RESEARCH_FOCUS_GAIN_BONUS
+            if self.research_focus and not tech_tree.get(self.research_focus, False)
+            else 1.0
+        )
+        # Refund for a baked item reaching the sink with no orders open.
+        waste_refund = (
+            int(RECIPES[next(iter(RECIPES))]["sell_price"] * PRECISION_COOKING_WASTE_REFUND)
+            if tech_tree.get("precision_cooking", False) and RECIPES
+            else 0
+        )
+        # Names the item loop touches per item, bound once.
+        grid = self.grid
+        dir_steps = DIR_STEPS
+        speed_of = speed_by_kind.get
+        flow_of = FLOW_STEPS.get
+        settle = moved_items.append
+        # Cells already holding an item that has settled this tick, row-major.
+        occupied = bytearray(GRID_W * GRID_H)
 
         for item in self.items:
-            tile = self.grid[item.y][item.x]
-            speed = 1.0 + turbo
-            if tile.kind in (MACHINE, PROCESSOR):
-                speed = 0.5 + (self.hygiene / 220.0)
-            elif tile.kind == OVEN:
-                oven_bonus = TURBO_OVEN_SPEED_BONUS if self.tech_tree.get("turbo_oven", False) else 0.0
-                speed = 0.35 + oven_bonus + (self.hygiene / 280.0)
-            elif tile.kind == ASSEMBLY_TABLE:
-                speed = ASSEMBLY_TABLE_SPEED
-            item.progress += dt * speed
+            tile = grid[item.y][item.x]
+            item.progress += dt * speed_of(tile.kind, belt_speed)
 
             if item.progress < 1.0:
-                moved_items.append(item)
+                settle(item)
+                occupied[item.y * GRID_W + item.x] = 1
                 continue
 
             item.progress = 0.0
             nx, ny = item.x, item.y
 
-            if tile.kind in (CONVEYOR, SOURCE, MACHINE, PROCESSOR, OVEN, BOT_DOCK, ASSEMBLY_TABLE):
-                flow = PROCESS_FLOW.get(tile.kind)
-                if flow and item.stage == flow["from"]:
-                    item.stage = flow["to"]
-                    rp_gain = float(flow["research_gain"])
-                    if self.research_focus and not self.tech_tree.get(self.research_focus, False):
-                        rp_gain *= 1.0 + RESEARCH_FOCUS_GAIN_BONUS
-                    self.research_points += rp_gain
-                    if "delivery_boost" in flow:
-                        item.delivery_boost = flow["delivery_boost"]
+            if tile.kind in FLOW_KINDS:
+                flow = flow_of(tile.kind)
+                if flow is not None and item.stage == flow[0]:
+                    item.stage = flow[1]
+                    items_changed = True
+                    self.research_points += flow[2] * rp_multiplier
+                    if flow[3] is not None:
+                        item.delivery_boost = flow[3]
                 if tile.kind == ASSEMBLY_TABLE and self.orders and not item.recipe_key:
                     for order in self.orders:
                         if self._ingredient_matches_order(item.ingredient_type, order):
                             item.recipe_key = order.recipe_key
                             break
-                nx, ny = self._next_pos(item.x, item.y, tile.rot)
+                dx, dy = dir_steps[tile.rot % 4]
+                nx += dx
+                ny += dy
             elif tile.kind == EMPTY:
                 blocked += 1
 
             if not (0 <= nx < GRID_W and 0 <= ny < GRID_H):
+                items_changed = True
                 continue
 
-            ntile = self.grid[ny][nx]
+            ntile = grid[ny][nx]
             if ntile.kind == SINK and item.stage == "baked":
                 if self.orders:
                     order = self._resolve_order_for_item(item)
@@ -825,41 +1077,51 @@ class FactorySim:
                         self._log_event("Order rejected: baked item recipe mismatch")
                 else:
                     self.waste += 1
-                    if self.tech_tree.get("precision_cooking", False) and RECIPES:
-                        default_recipe = next(iter(RECIPES))
-                        refund = int(RECIPES[default_recipe]["sell_price"] * PRECISION_COOKING_WASTE_REFUND)
-                        self.money += refund
-                        self.total_revenue += refund
+                    if waste_refund:
+                        self.money += waste_refund
+                        self.total_revenue += waste_refund
+                items_changed = True
                 continue
 
             if ntile.kind == EMPTY:
                 blocked += 1
-                moved_items.append(item)
+                settle(item)
+                occupied[item.y * GRID_W + item.x] = 1
                 continue
 
-            if any(o.x == nx and o.y == ny for o in moved_items):
+            if occupied[ny * GRID_W + nx]:
                 blocked += 1
-                moved_items.append(item)
+                settle(item)
+                occupied[item.y * GRID_W + item.x] = 1
                 continue
 
             item.x, item.y = nx, ny
-            moved_items.append(item)
+            items_changed = True
+            settle(item)
+            occupied[ny * GRID_W + nx] = 1
 
         self.items = moved_items
         self.bottleneck = clamp((blocked / max(1, len(self.items))) * 100.0, 0, 100)
         self._process_research()
 
         # Auto-bot delivery acceleration
-        docks = sum(1 for row in self.grid for tile in row if tile.kind == BOT_DOCK)
-        if self.tech_tree.get("bots", False) and docks > 0:
+        docks = self._bot_dock_count()
+        if tech_tree.get("bots", False) and docks > 0:
             self.auto_bot_charge += dt * (BOT_AUTO_CHARGE_RATE * docks)
-            while self.auto_bot_charge >= 1.0 and self.deliveries:
-                target = max(self.deliveries, key=lambda d: d.remaining)
-                target.remaining = max(0.4, target.remaining - BOT_AUTO_DELIVERY_REDUCTION)
-                self.auto_bot_charge -= 1.0
+            if self.auto_bot_charge >= 1.0 and self.deliveries:
+                # Each charge shortens the delivery with the most time left. The heap is keyed
+                # on (-remaining, position), so ties go to the earliest delivery as with max().
+                deliveries = self.deliveries
+                heap = [(-d.remaining, idx) for idx, d in enumerate(deliveries)]
+                heapify(heap)
+                while self.auto_bot_charge >= 1.0:
+                    target = deliveries[heap[0][1]]
+                    target.remaining = max(0.4, target.remaining - BOT_AUTO_DELIVERY_REDUCTION)
+                    heapreplace(heap, (-target.remaining, heap[0][1]))
+                    self.auto_bot_charge -= 1.0
 
         # Expansion tier progression
-        expansion_delivery_mult = FRANCHISE_EXPANSION_BONUS if self.tech_tree.get("franchise_system", False) else 1.0
+        expansion_delivery_mult = FRANCHISE_EXPANSION_BONUS if tech_tree.get("franchise_system", False) else 1.0
         self.expansion_progress += (dt * EXPANSION_PROGRESS_RATE) + (self.completed * EXPANSION_DELIVERY_BONUS * expansion_delivery_mult)
         needed = EXPANSION_BASE_NEEDED * self.expansion_level
         if self.expansion_progress >= needed:
@@ -867,23 +1129,27 @@ class FactorySim:
             self.expansion_level += 1
 
         # Order SLA countdown
-        next_orders: List[Order] = []
-        for order in self.orders:
+        # Both passes compact their list in place rather than building a new one.
+        orders = self.orders
+        kept = 0
+        for order in orders:
             order.remaining_sla -= dt
             if order.remaining_sla > 0:
-                next_orders.append(order)
+                orders[kept] = order
+                kept += 1
                 continue
             self._mark_order_missed(order)
-        self.orders = next_orders
+        del orders[kept:]
 
         # Delivery completion
         late_penalty = (
             PRIORITY_DISPATCH_LATE_MULTIPLIER
-            if self.tech_tree.get("priority_dispatch", False)
+            if tech_tree.get("priority_dispatch", False)
             else LATE_DELIVERY_PENALTY
         )
-        next_deliveries: List[Delivery] = []
-        for d in self.deliveries:
+        deliveries = self.deliveries
+        kept = 0
+        for d in deliveries:
             d.elapsed += dt
             d.remaining -= dt
             if d.remaining <= 0:
@@ -907,8 +1173,10 @@ class FactorySim:
                     stats["late"] += 1
                     stats["revenue"] += late_reward
             else:
-                next_deliveries.append(d)
-        self.deliveries = next_deliveries
+                deliveries[kept] = d
+                kept += 1
+        del deliveries[kept:]
+        return items_changed
 
     # ------------------------------------------------------------------
     # Properties
@@ -5,9 +5,11 @@ import json
 import os
 import math
 import sys
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Sequence, Tuple
 
 from config import (
     ASSEMBLY_TABLE,
@@ -26,12 +28,18 @@ from config import (
     SOURCE,
 )
 from game import FactorySim
+from game.simulation import COMMERCIALS, MACHINE_BUILD_COSTS
 
 try:
     import pygame  # type: ignore
 except Exception:
     pygame = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class RuntimeLayout:
@@ -57,6 +65,111 @@ class RuntimeLayout:
 
 
 UI_SETTINGS_FILE = Path("ui_settings.json")
+TEXT_CACHE_LIMIT = 256
+CHIP_ROWS_CACHE_LIMIT = 64
+SIM_TICK_DT = 1.0 / 30.0
+MAX_SIM_STEPS_PER_FRAME = 5
+MAX_TRACKED_TOUCHES = 8
+TARGET_FPS = 60
+IDLE_FPS = 30
+IDLE_FPS_MOBILE = 10
+# Taps closer than 20px to the radial menu centre dismiss it (compared squared).
+CONTEXT_MENU_DEAD_ZONE_SQ = 20 * 20
+# Tile kinds whose icon depends on rotation; other kinds share one cached surface.
+ROTATING_KINDS = frozenset((CONVEYOR, SOURCE))
+# Toolbar labels that name a tool, matched by substring ("1 Conveyor", "5 Delete", ...).
+TOOLBAR_TOOL_WORDS = (
+    ("Conveyor", CONVEYOR),
+    ("Processor", PROCESSOR),
+    ("Oven", OVEN),
+    ("Bot Dock", BOT_DOCK),
+    ("Assembly", ASSEMBLY_TABLE),
+    ("Delete", EMPTY),
+)
+# Indexed by Item.stage_id (raw, processed, baked); the last slot covers unknown stages.
+STAGE_COLORS = (
+    (219, 223, 235),
+    (255, 214, 126),
+    (255, 139, 94),
+    (255, 255, 255),
+)
+ITEM_OUTLINE_COLOR = (30, 34, 45)
+TILE_BASE_COLORS = {
+    EMPTY: (40, 44, 58),
+    CONVEYOR: (74, 126, 230),
+    MACHINE: (208, 158, 80),
+    PROCESSOR: (230, 190, 102),
+    OVEN: (232, 102, 61),
+    BOT_DOCK: (98, 211, 222),
+    ASSEMBLY_TABLE: (162, 110, 220),
+    SOURCE: (88, 193, 112),
+    SINK: (196, 98, 96),
+}
+UNKNOWN_TILE_COLOR = (100, 100, 100)
+# Highlight shade for the top half of each tile, keyed by base color.
+TILE_LIFT_COLORS = {
+    base: tuple(min(255, c + 25) for c in base)
+    for base in (*TILE_BASE_COLORS.values(), UNKNOWN_TILE_COLOR)
+}
+
+
+def _dump_json_bytes(payload: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json_bytes(raw: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _axis_positions(origin: int, cell: int, zoom: float, camera: float, count: int) -> List[int]:
+    """Screen coordinate of each grid line 0..count-1 along one axis (same maths as _grid_to_screen)."""
+    return [int(origin + i * cell * zoom - camera) for i in range(count)]
+
+
+def _collect_tile_blits(cells, grid, cell_rects, tile_cache, render_tile) -> List[tuple]:
+    """``(surface, dest)`` pairs for the visible built tiles among ``cells``.
+
+    A plain function over explicit arguments so the hot loop only touches locals
+    (and stays easy for a tracing JIT such as PyPy's to specialise). Tiles missing
+    from ``tile_cache`` go through ``render_tile(x, y, kind, rot)``.
+    """
+    get_tile = tile_cache.get
+    blits = []
+    append = blits.append
+    for x, y in cells:
+        rect = cell_rects[y][x]
+        if rect is None:
+            continue
+        tile = grid[y][x]
+        kind = tile.kind
+        cached = get_tile((kind, tile.rot if kind in ROTATING_KINDS else 0))
+        if cached is None:
+            blit = render_tile(x, y, kind, tile.rot)
+            if blit is not None:
+                append(blit)
+            continue
+        surface, pad = cached
+        append((surface, (rect.x - pad, rect.y - pad)))
+    return blits
+
+
+def _visible_indices(starts: Sequence[int], size: int, lo: int, hi: int) -> List[int]:
+    """Indices whose span ``[start, start + size)`` overlaps ``[lo, hi)``."""
+    if size <= 0:
+        return []
+    return [i for i, start in enumerate(starts) if start < hi and start + size > lo]
+
+
+ORDER_CHANNEL_LABELS = ("Delivery", "Takeaway", "Eat-in")
+COMMERCIAL_STRATEGY_LABELS = ("Campaigns", "Promos", "Franchise")
+ORDERS_LABEL_TO_KEY = {label: label.lower().replace("-", "_") for label in ORDER_CHANNEL_LABELS}
+ORDERS_KEY_TO_LABEL = {key: label for label, key in ORDERS_LABEL_TO_KEY.items()}
+COMMERCIALS_LABEL_TO_KEY = {label: label.lower() for label in COMMERCIAL_STRATEGY_LABELS}
+COMMERCIALS_KEY_TO_LABEL = {key: label for label, key in COMMERCIALS_LABEL_TO_KEY.items()}
 
 
 class GameUI:
@@ -119,10 +232,69 @@ class GameUI:
         self.sidebar_visible = True
         self.show_top_kpis = True
         self.show_floating_dock = True
+        # Last payload read from or written to disk; unchanged settings are not rewritten.
+        self._last_ui_settings_payload: Dict[str, str | bool] | None = None
         self._load_ui_settings()
 
         self.camera_x = 0.0
         self.camera_y = 0.0
+        # Per-cell screen rects (None when culled) and centers; rebuilt lazily after view changes.
+        self._cell_rects: List[List[pygame.Rect | None]] | None = None
+        self._cell_centers: List[List[Tuple[int, int]]] = []
+        # Pre-rendered tile surfaces keyed by (kind, rot) for the current cell size.
+        self._tile_cache: Dict[Tuple[str, int], Tuple[pygame.Surface, int]] = {}
+        self._tile_cache_cell = 0
+        self._item_sprites: Tuple[pygame.Surface, ...] | None = None
+        # Grid lines for the current view, rebuilt alongside the cell rect table.
+        self._grid_overlay: pygame.Surface | None = None
+        self._grid_bg: pygame.Surface | None = None
+        # Floor plus built tiles for the current view, keyed by (sim, sim.grid_version).
+        self._board: pygame.Surface | None = None
+        self._board_key: tuple | None = None
+        # (kind, rot) of every built tile composed into the board, for patching single edits.
+        self._board_tiles: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        # The board with the grid lines on top, used whenever no placement preview is showing.
+        self._board_lined: pygame.Surface | None = None
+        # Sidebar background and divider; only the layout moves them.
+        self._sidebar_shell: pygame.Surface | None = None
+        # Snapshot of the rendered sidebar and the values it shows.
+        self._sidebar_cache: pygame.Surface | None = None
+        self._sidebar_cache_key: tuple | None = None
+        # Bumped on every reflow; keys the memoised chip/toolbar rect layouts.
+        self._layout_version = 0
+        self._ui_rects_cache: Tuple[tuple, Dict[str, List[Tuple[pygame.Rect, str]]]] | None = None
+        self._toolbar_rects_cache: Tuple[tuple, List[Tuple[pygame.Rect, str]], int] | None = None
+        self._hit_table_cache: tuple | None = None
+        # Rendered sidebar KPI rows and status line, keyed by the values they show.
+        self._hud_rows_cache: Tuple[tuple, List[pygame.Surface]] | None = None
+        self._status_line_cache: Tuple[tuple, pygame.Surface] | None = None
+        # Snapshot of the bottom panel (background, chips, toolbar) and the state it shows.
+        self._panel_cache: pygame.Surface | None = None
+        self._panel_cache_key: tuple | None = None
+        # Rendered labels keyed by (font, text, color); reset when fonts are rebuilt.
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+        # Fully rendered chips keyed by (label, active, style, w, h); reset with the fonts.
+        self._chip_cache: Dict[tuple, Tuple[pygame.Surface, pygame.Surface | None]] = {}
+        # Rotation chips keyed by (rot, active, w, h); the label rides separately if it overhangs.
+        self._rotation_chip_cache: Dict[tuple, Tuple[pygame.Surface, Tuple[pygame.Surface, Tuple[int, int]] | None]] = {}
+        self._size_cache: Dict[str, Tuple[int, int]] = {}
+        # Toolbar label -> tool kind it selects (None for non-tool actions).
+        self._toolbar_tool_cache: Dict[str, str | None] = {}
+        # Chip row layouts keyed by their inputs and the layout version.
+        self._chip_rows_cache: Dict[tuple, Tuple[List[Tuple[pygame.Rect, str]], int]] = {}
+        # SysFont lookups are slow, so fonts are shared per pixel size across reflows.
+        self._font_cache: Dict[int, pygame.font.Font] = {}
+        self._font_sizes: Tuple[int, int, int] | None = None
+        self._reflow_inputs: tuple | None = None
+        # Viewport size as floats for mapping normalised finger coordinates.
+        self._touch_scale = (1.0, 1.0)
+        # Redraw only when input arrived or the sim reports a visible change.
+        self._dirty = True
+        self._last_sim_frame = -1
+        self._presented_item_rects: List[pygame.Rect] | None = None
+        self._presented_panel_key: tuple = ()
+        # (grid_x, grid_y, grid_px_w, grid_px_h, cell_size, zoom) for the coordinate transforms.
+        self._transform: Tuple[int, int, int, int, int, float] = (0, 0, 0, 0, CELL, 1.0)
         # Keep gameplay tiles more legible on touch devices while preserving pinch-pan control.
         self.zoom = 1.55 if self.touch_mode else 1.0
         self.min_zoom = 1.0 if self.touch_mode else 0.6
@@ -141,6 +313,9 @@ class GameUI:
         self.font = pygame.font.SysFont("arial", 22)
         self.small = pygame.font.SysFont("arial", 17)
         self.chip_font = self.small
+        # These startup fonts replace the layout-sized ones; let the next reflow restore them.
+        self._font_sizes = None
+        self._reflow_inputs = None
         self.running = True
         self.selected = CONVEYOR
         self.row_mode_defaults: Dict[str, bool] = {
@@ -161,9 +336,16 @@ class GameUI:
         self.pointer_down_time = 0
         self.last_drag_cell: Tuple[int, int] | None = None
         self.long_press_cell: Tuple[int, int] | None = None
+        # True while a build gesture holds a FactorySim.begin_batch() bracket open.
+        self._sim_batch_open = False
         self.long_press_ms = 420
         self.drag_threshold_px = 14
-        self.active_touches: Dict[int, Tuple[int, int]] = {}
+        self._drag_threshold_sq = self.drag_threshold_px * self.drag_threshold_px
+        # Finger positions live in fixed slots so motion events update ints in place.
+        self._touch_x = array("i", [0] * MAX_TRACKED_TOUCHES)
+        self._touch_y = array("i", [0] * MAX_TRACKED_TOUCHES)
+        self._touch_slot: Dict[int, int] = {}
+        self._free_touch_slots: List[int] = list(range(MAX_TRACKED_TOUCHES - 1, -1, -1))
         self.touch_order: List[int] = []
         self.pinch_distance = 0.0
         self.pinch_zoom_start = self.zoom
@@ -171,11 +353,19 @@ class GameUI:
         self.context_menu_center = (0, 0)
         self.context_menu_radius = 64
         self.context_menu_actions = ["rotate", "delete", "inspect"]
+        # Label centres for the open menu, placed once when it opens.
+        self._context_menu_label_centers: List[Tuple[int, int]] = []
         self.status_message = ""
         self.placement_mode = "idle"
         self.placement_start_cell: Tuple[int, int] | None = None
         self.placement_end_cell: Tuple[int, int] | None = None
         self.pending_cells: List[Tuple[int, int, bool]] = []
+        self._rd_cache: Tuple[tuple, List[str]] | None = None
+        # Static lock labels per channel/strategy key, dropped when the sim reports an unlock.
+        self._orders_meta: Dict[str, int] = {}
+        self._commercials_meta: Dict[str, str] = {}
+        self._meta_unlocks_version = -1
+        self._subsection_cache: Dict[str, Tuple[tuple, List[str]]] = {}
 
         self.main_sections = ["Build", "Orders", "R&D", "Commercials", "Info"]
         self.rotation_chip_labels = {
@@ -203,16 +393,16 @@ class GameUI:
         }
         self.section_defaults = {
             "Build": [str(config["label"]) for config in self.build_tool_configs.values()],
-            "Orders": ["Delivery", "Takeaway", "Eat-in"],
+            "Orders": list(ORDER_CHANNEL_LABELS),
             "R&D": ["Cycle", "Unlock", "Clear"],
-            "Commercials": ["Campaigns", "Promos", "Franchise"],
+            "Commercials": list(COMMERCIAL_STRATEGY_LABELS),
             "Info": ["KPIs", "Logs", "Economy"],
         }
         self.active_section = "Build"
         self.active_subsection = self._subsections_for(self.active_section)[0]
         self.order_channel = self.sim.order_channel
         self.commercial_strategy = self.sim.commercial_strategy
-        self.toolbar_actions = [
+        self.toolbar_actions: Tuple[str, ...] = (
             "1 Conveyor",
             "2 Processor",
             "3 Oven",
@@ -223,14 +413,33 @@ class GameUI:
             "U Unlock",
             "S Save",
             "L Load",
-        ]
-        self.build_toolbar_actions = {
-            "Conveyor": ["S Save", "L Load", "C Cycle R&D", "U Unlock"],
-            "Processor": ["S Save", "L Load", "C Cycle R&D", "U Unlock"],
-            "Oven": ["S Save", "L Load", "C Cycle R&D", "U Unlock"],
-            "Bot Dock": ["S Save", "L Load", "C Cycle R&D", "U Unlock"],
-            "Assembly": ["S Save", "L Load", "C Cycle R&D", "U Unlock"],
-            "Delete": ["S Save", "L Load", "C Cycle R&D", "U Unlock"],
+        )
+        build_actions = ("S Save", "L Load", "C Cycle R&D", "U Unlock")
+        self.build_toolbar_actions: Dict[str, Tuple[str, ...]] = {
+            "Conveyor": build_actions,
+            "Processor": build_actions,
+            "Oven": build_actions,
+            "Bot Dock": build_actions,
+            "Assembly": build_actions,
+            "Delete": build_actions,
+        }
+        self.default_build_toolbar_actions = build_actions
+        # Handlers return False when the action does not apply (e.g. no save to load).
+        self._toolbar_dispatch: Dict[str, Callable[[], bool | None]] = {
+            "Cancel": self._clear_pending_placement,
+            "Confirm": self._toolbar_confirm,
+            "1 Conveyor": lambda: self._set_selected_build_tool(CONVEYOR, "Conveyor"),
+            "2 Processor": lambda: self._set_selected_build_tool(PROCESSOR, "Processor"),
+            "3 Oven": lambda: self._set_selected_build_tool(OVEN, "Oven"),
+            "4 Bot Dock": lambda: self._set_selected_build_tool(BOT_DOCK, "Bot Dock"),
+            "6 Assembly": lambda: self._set_selected_build_tool(ASSEMBLY_TABLE, "Assembly"),
+            "5 Delete": lambda: self._set_selected_build_tool(EMPTY),
+            "Rot -": lambda: self._step_rotation(-1),
+            "Rot +": lambda: self._step_rotation(1),
+            "C Cycle R&D": self._toolbar_cycle_research,
+            "U Unlock": self._toolbar_unlock_research,
+            "S Save": self._toolbar_save,
+            "L Load": self._toolbar_load,
         }
 
         self.palette = {
@@ -246,12 +455,21 @@ class GameUI:
             "chip_active_border": (180, 215, 255),
         }
 
+        # Event type -> handler. Only these types (plus coalesced mouse motion) are
+        # let onto the SDL queue, so the per-frame get() never copies ignored events.
+        self._event_dispatch = self._build_event_dispatch()
+        self._key_actions = self._build_key_actions()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.MOUSEMOTION, *self._event_dispatch])
+
     def _select_display_mode(self) -> str:
+        env = os.environ.get
+        # The launcher variables are cheap presence checks; only lower-case the paths if they miss.
         is_android = (
-            os.environ.get("ANDROID_ARGUMENT") is not None
-            or os.environ.get("P4A_BOOTSTRAP") is not None
-            or "pydroid" in os.environ.get("PYTHONHOME", "").lower()
-            or "pydroid" in os.environ.get("TERMUX_VERSION", "").lower()
+            env("ANDROID_ARGUMENT") is not None
+            or env("P4A_BOOTSTRAP") is not None
+            or "pydroid" in env("PYTHONHOME", "").lower()
+            or "pydroid" in env("TERMUX_VERSION", "").lower()
         )
         return "mobile_fullscreen" if is_android else "desktop_windowed"
 
@@ -259,23 +477,33 @@ class GameUI:
         if not UI_SETTINGS_FILE.exists():
             return
         try:
-            data = json.loads(UI_SETTINGS_FILE.read_text())
-        except (OSError, json.JSONDecodeError):
+            data = _load_json_bytes(UI_SETTINGS_FILE.read_bytes())
+        except (OSError, ValueError):
             return
         if str(data.get("bottom_sheet_state", "")) in self.hud_state_cycle:
             self.bottom_sheet_state = str(data["bottom_sheet_state"])
         self.sidebar_visible = bool(data.get("sidebar_visible", self.sidebar_visible))
         self.show_top_kpis = bool(data.get("show_top_kpis", self.show_top_kpis))
         self.show_floating_dock = bool(data.get("show_floating_dock", self.show_floating_dock))
+        self._last_ui_settings_payload = self._ui_settings_payload()
 
-    def _save_ui_settings(self) -> None:
-        payload = {
+    def _ui_settings_payload(self) -> Dict[str, str | bool]:
+        return {
             "bottom_sheet_state": self.bottom_sheet_state,
             "sidebar_visible": self.sidebar_visible,
             "show_top_kpis": self.show_top_kpis,
             "show_floating_dock": self.show_floating_dock,
         }
-        UI_SETTINGS_FILE.write_text(json.dumps(payload, indent=2))
+
+    def _save_ui_settings(self) -> None:
+        payload = self._ui_settings_payload()
+        if payload == self._last_ui_settings_payload:
+            return
+        # Write to a sibling temp file and swap it in so a crash never leaves a torn file.
+        tmp = UI_SETTINGS_FILE.with_suffix(".tmp")
+        tmp.write_bytes(_dump_json_bytes(payload))
+        os.replace(tmp, UI_SETTINGS_FILE)
+        self._last_ui_settings_payload = payload
 
     def _cycle_bottom_sheet_state(self) -> None:
         idx = self.hud_state_cycle.index(self.bottom_sheet_state)
@@ -286,6 +514,19 @@ class GameUI:
     def _reflow_layout(self, viewport_w: int | None = None, viewport_h: int | None = None) -> None:
         if viewport_w is None or viewport_h is None:
             viewport_w, viewport_h = self.screen.get_size()
+        # Every layout field derives from these; an unchanged tuple means nothing to redo.
+        inputs = (
+            viewport_w,
+            viewport_h,
+            self.display_mode,
+            self.show_top_kpis,
+            self.bottom_sheet_state,
+            self.sidebar_visible,
+        )
+        if inputs == self._reflow_inputs and self.layout is not None:
+            return
+        self._reflow_inputs = inputs
+        self._touch_scale = (float(viewport_w), float(viewport_h))
 
         landscape = viewport_w >= viewport_h
         mobile = self.display_mode == "mobile_fullscreen"
@@ -337,6 +578,7 @@ class GameUI:
             panel_y=viewport_h - safe_bottom - bottom_sheet_h,
             panel_h=bottom_sheet_h,
         )
+        self._recompute_transform_cache()
 
         self.landscape = landscape
         self.sidebar_w = side_panel_w
@@ -345,14 +587,60 @@ class GameUI:
         self.grid_px_w = grid_px_w
         self.grid_px_h = grid_px_h
         self.panel_h = bottom_sheet_h
+        # Hit-test rects for the HUD only move with the layout, so build them here.
+        self.hud_toggle_rects: List[Tuple[pygame.Rect, str]] = []
+        self.sidebar_toggle_rect: pygame.Rect | None = (
+            pygame.Rect(play_w - 24, 12, 22, 54) if landscape else None
+        )
         self._clamp_camera()
+        self._cell_rects = None
+        self._sidebar_shell = None
+        self._dirty = True
 
         chip_size = max(17, int(self.touch_target_min_h * 0.42))
         small_size = max(15, int(chip_size * 0.86))
         body_size = max(21, int(chip_size * 1.2))
-        self.chip_font = pygame.font.SysFont("arial", chip_size)
-        self.small = pygame.font.SysFont("arial", small_size)
-        self.font = pygame.font.SysFont("arial", body_size)
+        font_sizes = (chip_size, small_size, body_size)
+        if font_sizes != self._font_sizes:
+            self._font_sizes = font_sizes
+            self.chip_font = self._sysfont(chip_size)
+            self.small = self._sysfont(small_size)
+            self.font = self._sysfont(body_size)
+            self._text_cache.clear()
+            self._chip_cache.clear()
+            self._rotation_chip_cache.clear()
+            self._size_cache.clear()
+        self._chip_rows_cache.clear()
+        self._layout_version += 1
+
+    def _sysfont(self, size: int) -> pygame.font.Font:
+        font = self._font_cache.get(size)
+        if font is None:
+            font = pygame.font.SysFont("arial", size)
+            self._font_cache[size] = font
+        return font
+
+    def _chip_text_size(self, text: str) -> Tuple[int, int]:
+        size = self._size_cache.get(text)
+        if size is None:
+            size = self.chip_font.size(text)
+            self._size_cache[text] = size
+        return size
+
+    def _render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        # Least-recently-used eviction on insertion order: a hit moves the key to the end.
+        cache = self._text_cache
+        key = (font, text, color)
+        surface = cache.pop(key, None)
+        if surface is None:
+            if len(cache) >= TEXT_CACHE_LIMIT:
+                del cache[next(iter(cache))]
+            surface = font.render(text, True, color).convert_alpha()
+        cache[key] = surface
+        return surface
+
+    def _text(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        return self._render(self.small, text, color)
 
     def _toolbar_button_label(self, label: str) -> str:
         if not self.touch_mode:
@@ -364,31 +652,56 @@ class GameUI:
 
     def _layout_chip_rows(
         self,
-        labels: List[str],
+        labels: Sequence[str],
+        start_y: int,
+        min_width: int,
+        min_height: int,
+        gap_x: int,
+        gap_y: int,
+        label_fn=None,
+    ) -> Tuple[List[Tuple[pygame.Rect, str]], int]:
+        """Lay out ``labels`` as wrapping chip rows; return the rects and the lowest chip bottom."""
+        key = (self._layout_version, tuple(labels), start_y, min_width, min_height, gap_x, gap_y, label_fn)
+        rows = self._chip_rows_cache.get(key)
+        if rows is None:
+            if len(self._chip_rows_cache) >= CHIP_ROWS_CACHE_LIMIT:
+                self._chip_rows_cache.clear()
+            rows = self._compute_chip_rows(labels, start_y, min_width, min_height, gap_x, gap_y, label_fn)
+            self._chip_rows_cache[key] = rows
+        return rows
+
+    def _compute_chip_rows(
+        self,
+        labels: Sequence[str],
         start_y: int,
         min_width: int,
         min_height: int,
         gap_x: int,
         gap_y: int,
         label_fn=None,
-    ) -> List[Tuple[pygame.Rect, str]]:
+    ) -> Tuple[List[Tuple[pygame.Rect, str]], int]:
         assert self.layout is not None
         x = 10
         y = start_y
+        bottom = start_y
         max_x = self.layout.play_w - 10
         rects: List[Tuple[pygame.Rect, str]] = []
-        render_label = label_fn or (lambda text: text)
-        for value in labels:
-            shown = render_label(value)
-            text_w, text_h = self.chip_font.size(shown)
-            width = max(min_width, text_w + self.touch_horizontal_padding * 2)
+        text_size = self._chip_text_size
+        pad2 = self.touch_horizontal_padding * 2
+        Rect = pygame.Rect
+        shown_labels = labels if label_fn is None else [label_fn(value) for value in labels]
+        for value, shown in zip(labels, shown_labels):
+            text_w, text_h = text_size(shown)
+            width = max(min_width, text_w + pad2)
             height = max(min_height, text_h + 14)
             if x + width > max_x and x > 10:
                 x = 10
                 y += height + gap_y
-            rects.append((pygame.Rect(x, y, width, height), value))
+            rects.append((Rect(x, y, width, height), value))
+            if y + height > bottom:
+                bottom = y + height
             x += width + gap_x
-        return rects
+        return rects, bottom
 
     def _camera_world_size(self) -> Tuple[float, float]:
         assert self.layout is not None
@@ -404,25 +717,169 @@ class GameUI:
         self.camera_x = max(0.0, min(max_x, self.camera_x))
         self.camera_y = max(0.0, min(max_y, self.camera_y))
 
+    def _recompute_transform_cache(self) -> None:
+        layout = self.layout
+        assert layout is not None
+        self._transform = (layout.grid_x, layout.grid_y, layout.grid_px_w, layout.grid_px_h, layout.cell_size, self.zoom)
+
     def _grid_to_screen(self, gx: float, gy: float) -> Tuple[int, int]:
-        assert self.layout is not None
-        cell = self.layout.cell_size
-        sx = self.layout.grid_x + gx * cell * self.zoom - self.camera_x
-        sy = self.layout.grid_y + gy * cell * self.zoom - self.camera_y
+        grid_x, grid_y, _, _, cell, zoom = self._transform
+        sx = grid_x + gx * cell * zoom - self.camera_x
+        sy = grid_y + gy * cell * zoom - self.camera_y
         return int(sx), int(sy)
 
-    def _screen_to_grid(self, mx: int, my: int) -> Tuple[int, int] | None:
+    def _rebuild_cell_rects(self) -> None:
+        assert self.layout is not None
+        cell = int(self.layout.cell_size * self.zoom)
+        if cell != self._tile_cache_cell:
+            self._tile_cache.clear()
+            self._item_sprites = None
+            self._tile_cache_cell = cell
+        # Screen x depends only on the column and y only on the row, so the transform
+        # and the viewport test run once per column/row instead of once per cell.
+        size = cell - 2
+        half = size // 2
+        left, top, grid_w, grid_h, cell_size, zoom = self._transform
+        cols = [px + 1 for px in _axis_positions(left, cell_size, zoom, self.camera_x, GRID_W)]
+        rows = [py + 1 for py in _axis_positions(top, cell_size, zoom, self.camera_y, GRID_H)]
+        visible_cols = _visible_indices(cols, size, left, left + grid_w)
+        visible_rows = set(_visible_indices(rows, size, top, top + grid_h))
+        Rect = pygame.Rect
+        rects: List[List[pygame.Rect | None]] = []
+        centers: List[List[Tuple[int, int]]] = []
+        for y, py in enumerate(rows):
+            cy = py + half
+            centers.append([(px + half, cy) for px in cols])
+            rect_row: List[pygame.Rect | None] = [None] * GRID_W
+            if y in visible_rows:
+                for x in visible_cols:
+                    rect_row[x] = Rect(cols[x], py, size, size)
+            rects.append(rect_row)
+        self._cell_rects = rects
+        self._cell_centers = centers
+        self._grid_overlay = self._build_grid_overlay()
+        self._grid_bg = self._build_grid_background()
+        self._board = None
+
+    def _build_item_sprites(self, cell: int) -> Tuple[pygame.Surface, ...]:
+        # One outlined disc per entry of STAGE_COLORS, indexed by Item.stage_id.
+        r_outer = max(5, cell // 4)
+        r_inner = max(3, cell // 6)
+        c = r_outer + 1
+        sprites = []
+        for color in STAGE_COLORS:
+            sprite = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, ITEM_OUTLINE_COLOR, (c, c), r_outer)
+            pygame.draw.circle(sprite, color, (c, c), r_inner)
+            sprites.append(sprite.convert_alpha())
+        return tuple(sprites)
+
+    def _build_grid_background(self) -> pygame.Surface:
+        # Every cell rendered as empty floor; built tiles are blitted over their cells each frame.
+        assert self.layout is not None
+        surface = pygame.Surface((self.layout.play_w, self.layout.panel_y)).convert()
+        surface.fill(self.palette["bg"])
+        blits = []
+        for y in range(GRID_H):
+            for x in range(GRID_W):
+                blit = self._tile_blit(x, y, EMPTY, 0)
+                if blit is not None:
+                    blits.append(blit)
+        surface.blits(blits, doreturn=False)
+        return surface
+
+    def _build_sidebar_shell(self) -> pygame.Surface:
+        assert self.layout is not None
+        surface = pygame.Surface((self.layout.side_panel_w, self.layout.viewport_h)).convert()
+        surface.fill((16, 21, 33))
+        pygame.draw.line(surface, self.palette["panel_border"], (0, 0), (0, self.layout.viewport_h), 2)
+        return surface
+
+    def _build_board(self) -> pygame.Surface:
+        assert self.layout is not None and self._grid_bg is not None and self._cell_rects is not None
+        # Window-wide so tiles overhanging the play area land where they did on screen;
+        # the panel and sidebar are drawn over it afterwards.
+        surface = pygame.Surface((self.layout.viewport_w, self.layout.panel_y)).convert()
+        surface.fill(self.palette["bg"])
+        surface.blit(self._grid_bg, (0, 0))
+        # One blits() call for the built tiles instead of a blit per cell.
+        cells = self.sim.non_empty_cells()
+        tile_blits = _collect_tile_blits(cells, self.sim.grid, self._cell_rects, self._tile_cache, self._tile_blit)
+        surface.blits(tile_blits, doreturn=False)
+        grid = self.sim.grid
+        self._board_tiles = {(x, y): (grid[y][x].kind, grid[y][x].rot) for x, y in cells}
+        return surface
+
+    def _patch_board(self) -> None:
+        # Recompose only the cells whose tile changed. Padded tile surfaces overhang their
+        # neighbours, so each dirty area is rebuilt under a clip from the floor up,
+        # replaying every tile that touches it in row-major order.
+        assert self._board is not None and self._grid_bg is not None
+        grid = self.sim.grid
+        cells = self.sim.non_empty_cells()
+        tiles = {(x, y): (grid[y][x].kind, grid[y][x].rot) for x, y in cells}
+        previous = self._board_tiles
+        dirty: List[pygame.Rect] = []
+        for x, y in previous.keys() | tiles.keys():
+            before = previous.get((x, y))
+            after = tiles.get((x, y))
+            if before == after:
+                continue
+            for state in (before, after):
+                blit = self._tile_blit(x, y, *state) if state is not None else None
+                if blit is not None:
+                    dirty.append(pygame.Rect(blit[1], blit[0].get_size()))
+        self._board_tiles = tiles
+        if not dirty:
+            return
+        board = self._board
+        placed = []
+        for x, y in cells:
+            blit = self._tile_blit(x, y, *tiles[(x, y)])
+            if blit is not None:
+                placed.append((pygame.Rect(blit[1], blit[0].get_size()), blit))
+        for area in dirty:
+            board.set_clip(area)
+            board.fill(self.palette["bg"])
+            board.blit(self._grid_bg, (0, 0))
+            board.blits([blit for rect, blit in placed if rect.colliderect(area)], doreturn=False)
+        board.set_clip(None)
+
+    def _build_grid_overlay(self) -> pygame.Surface:
         assert self.layout is not None
-        if not (
-            self.layout.grid_x <= mx < self.layout.grid_x + self.layout.grid_px_w
-            and self.layout.grid_y <= my < self.layout.grid_y + self.layout.grid_px_h
-        ):
+        ox, oy = self.layout.grid_x, self.layout.grid_y
+        w, h = self.layout.grid_px_w, self.layout.grid_px_h
+        surface = pygame.Surface((w + 1, h + 1), pygame.SRCALPHA)
+        line = self.palette["grid_line"]
+        _, _, _, _, cell, zoom = self._transform
+        # Each axis is one zigzag polyline; its joining runs sit one pixel outside the
+        # surface, so clipping leaves exactly the grid lines.
+        points: List[Tuple[int, int]] = []
+        ends = (-1, h + 1)
+        for i, xpos in enumerate(_axis_positions(ox, cell, zoom, self.camera_x, GRID_W + 1)):
+            xpos -= ox
+            points.append((xpos, ends[i & 1]))
+            points.append((xpos, ends[~i & 1]))
+        pygame.draw.lines(surface, line, False, points, 1)
+        points = []
+        ends = (-1, w + 1)
+        for i, ypos in enumerate(_axis_positions(oy, cell, zoom, self.camera_y, GRID_H + 1)):
+            ypos -= oy
+            points.append((ends[i & 1], ypos))
+            points.append((ends[~i & 1], ypos))
+        pygame.draw.lines(surface, line, False, points, 1)
+        return surface.convert_alpha()
+
+    def _screen_to_grid(self, mx: int, my: int) -> Tuple[int, int] | None:
+        grid_x, grid_y, grid_w, grid_h, cell, zoom = self._transform
+        dx = mx - grid_x
+        dy = my - grid_y
+        if dx < 0 or dy < 0 or dx >= grid_w or dy >= grid_h:
             return None
-        local_x = (mx - self.layout.grid_x + self.camera_x) / self.zoom
-        local_y = (my - self.layout.grid_y + self.camera_y) / self.zoom
-        gx = int(local_x // self.layout.cell_size)
-        gy = int(local_y // self.layout.cell_size)
-        if 0 <= gx < GRID_W and 0 <= gy < GRID_H:
+        gx = int((dx + self.camera_x) / zoom // cell)
+        gy = int((dy + self.camera_y) / zoom // cell)
+        # Zoomed-out views leave screen space past the last column/row, so keep the grid bounds check.
+        if gx < GRID_W and gy < GRID_H:
             return gx, gy
         return None
 
@@ -430,11 +887,13 @@ class GameUI:
         self.camera_x -= dx
         self.camera_y -= dy
         self._clamp_camera()
+        self._cell_rects = None
 
     def _set_zoom_around(self, new_zoom: float, anchor_x: int, anchor_y: int) -> None:
         assert self.layout is not None
         old_zoom = self.zoom
         self.zoom = max(self.min_zoom, min(self.max_zoom, new_zoom))
+        self._recompute_transform_cache()
         if abs(self.zoom - old_zoom) < 1e-6:
             return
         wx = (anchor_x - self.layout.grid_x + self.camera_x) / old_zoom
@@ -442,6 +901,7 @@ class GameUI:
         self.camera_x = wx * self.zoom - (anchor_x - self.layout.grid_x)
         self.camera_y = wy * self.zoom - (anchor_y - self.layout.grid_y)
         self._clamp_camera()
+        self._cell_rects = None
 
     def _apply_tile_action(self, gx: int, gy: int) -> None:
         self.sim.place_tile(gx, gy, self.selected, self.rotation)
@@ -481,8 +941,6 @@ class GameUI:
         if kind == EMPTY:
             return True, available_money
         if tile.kind == EMPTY:
-            from game.simulation import MACHINE_BUILD_COSTS
-
             cost = MACHINE_BUILD_COSTS.get(kind, 0)
             if available_money < cost:
                 return False, available_money
@@ -550,8 +1008,7 @@ class GameUI:
         if not self._can_confirm_pending():
             self.status_message = "Placement blocked: adjust selection or cancel"
             return
-        for gx, gy, _ in self.pending_cells:
-            self.sim.place_tile(gx, gy, self.selected, self.rotation)
+        self.sim.place_tile_batch([(gx, gy) for gx, gy, _ in self.pending_cells], self.selected, self.rotation)
         self.status_message = f"Placed {len(self.pending_cells)} tile(s)"
         self._clear_pending_placement()
 
@@ -574,28 +1031,17 @@ class GameUI:
         )
 
     def _apply_drag_line(self, start: Tuple[int, int], end: Tuple[int, int]) -> None:
-        x0, y0 = start
-        x1, y1 = end
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx - dy
-        while True:
-            self._apply_tile_action(x0, y0)
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x0 += sx
-            if e2 < dx:
-                err += dx
-                y0 += sy
+        self.sim.place_tile_batch(self._line_cells(start, end), self.selected, self.rotation)
 
     def _start_context_menu(self, cell: Tuple[int, int], px: int, py: int) -> None:
         self.context_menu_cell = cell
         self.context_menu_center = (px, py)
+        step = (2 * math.pi) / len(self.context_menu_actions)
+        reach = self.context_menu_radius - 22
+        self._context_menu_label_centers = [
+            (int(px + math.cos(idx * step) * reach), int(py + math.sin(idx * step) * reach))
+            for idx in range(len(self.context_menu_actions))
+        ]
 
     def _handle_context_menu_click(self, mx: int, my: int) -> bool:
         if self.context_menu_cell is None:
@@ -603,13 +1049,12 @@ class GameUI:
         cx, cy = self.context_menu_center
         dx = mx - cx
         dy = my - cy
-        dist = math.hypot(dx, dy)
-        if dist < 20:
+        if dx * dx + dy * dy < CONTEXT_MENU_DEAD_ZONE_SQ:
             self.context_menu_cell = None
             return True
-        step = (2 * math.pi) / len(self.context_menu_actions)
-        angle = (math.atan2(dy, dx) + 2 * math.pi) % (2 * math.pi)
-        idx = int(((angle + step / 2) % (2 * math.pi)) // step)
+        # Nearest wedge: atan2 is in (-pi, pi], so adding n keeps the floor positive.
+        n = len(self.context_menu_actions)
+        idx = int(math.atan2(dy, dx) * n / math.tau + 0.5 + n) % n
         action = self.context_menu_actions[idx]
         gx, gy = self.context_menu_cell
         if action == "rotate":
@@ -624,15 +1069,15 @@ class GameUI:
         return True
 
     def _touch_to_screen(self, ev) -> Tuple[int, int]:
-        assert self.layout is not None
-        return int(ev.x * self.layout.viewport_w), int(ev.y * self.layout.viewport_h)
+        w, h = self._touch_scale
+        return int(ev.x * w), int(ev.y * h)
 
     def _build_tool_selected(self) -> bool:
         return self.selected in {CONVEYOR, PROCESSOR, OVEN, BOT_DOCK, ASSEMBLY_TABLE, EMPTY}
 
     def _debounced_drag(self, mx: int, my: int) -> None:
         pos = self._screen_to_grid(mx, my)
-        if pos is None:
+        if pos is None or pos == self.last_drag_cell:
             return
         if self.last_drag_cell is None:
             self._apply_tile_action(*pos)
@@ -649,13 +1094,22 @@ class GameUI:
         self.pointer_mode = "build" if self._build_tool_selected() else ""
         self.long_press_cell = self._screen_to_grid(x, y)
         self.last_drag_cell = None
+        if self.pointer_mode == "build" and not self._sim_batch_open:
+            # A drag stroke may place many tiles; report them to the renderer as one change.
+            self.sim.begin_batch()
+            self._sim_batch_open = True
+
+    def _end_sim_batch(self) -> None:
+        if self._sim_batch_open:
+            self.sim.end_batch()
+            self._sim_batch_open = False
 
     def _handle_pointer_move(self, x: int, y: int, rel_x: float, rel_y: float) -> None:
         if not self.pointer_down:
             return
         dx = x - self.pointer_down_pos[0]
         dy = y - self.pointer_down_pos[1]
-        if not self.pointer_dragging and math.hypot(dx, dy) > self.drag_threshold_px:
+        if not self.pointer_dragging and dx * dx + dy * dy > self._drag_threshold_sq:
             self.pointer_dragging = True
             if self.pointer_mode == "build" and self.selected == CONVEYOR:
                 self.last_drag_cell = self._screen_to_grid(*self.pointer_down_pos)
@@ -683,6 +1137,7 @@ class GameUI:
         self.pointer_dragging = False
         self.pointer_mode = ""
         self.last_drag_cell = None
+        self._end_sim_batch()
 
     def _handle_grid_tap(self, pos: Tuple[int, int]) -> None:
         if self.row_mode_enabled:
@@ -732,35 +1187,48 @@ class GameUI:
         tx, ty = self._touch_to_screen(ev)
         finger_id = int(getattr(ev, "finger_id", 0))
         if down:
-            self.active_touches[finger_id] = (tx, ty)
+            slot = self._touch_slot.get(finger_id)
+            if slot is None:
+                if not self._free_touch_slots:
+                    return
+                slot = self._free_touch_slots.pop()
+                self._touch_slot[finger_id] = slot
+            self._touch_x[slot] = tx
+            self._touch_y[slot] = ty
             if finger_id not in self.touch_order:
                 self.touch_order.append(finger_id)
         else:
-            self.active_touches.pop(finger_id, None)
+            slot = self._touch_slot.pop(finger_id, None)
+            if slot is not None:
+                self._free_touch_slots.append(slot)
             self.touch_order = [fid for fid in self.touch_order if fid != finger_id]
 
     def _handle_touch_motion(self, ev) -> None:
         tx, ty = self._touch_to_screen(ev)
-        fid = int(getattr(ev, "finger_id", 0))
-        self.active_touches[fid] = (tx, ty)
-        if len(self.touch_order) >= 2:
-            f1, f2 = self.touch_order[0], self.touch_order[1]
-            p1 = self.active_touches.get(f1)
-            p2 = self.active_touches.get(f2)
-            if p1 and p2:
-                mid_x = int((p1[0] + p2[0]) / 2)
-                mid_y = int((p1[1] + p2[1]) / 2)
-                dist = math.hypot(p1[0] - p2[0], p1[1] - p2[1])
-                if self.pinch_distance == 0.0:
-                    self.pinch_distance = dist
-                    self.pinch_zoom_start = self.zoom
-                else:
-                    ratio = dist / max(1.0, self.pinch_distance)
-                    self._set_zoom_around(self.pinch_zoom_start * ratio, mid_x, mid_y)
-                rel_x = ev.dx * self.layout.viewport_w
-                rel_y = ev.dy * self.layout.viewport_h
-                self._pan_camera(rel_x, rel_y)
-                self.pointer_down = False
+        slots = self._touch_slot
+        xs = self._touch_x
+        ys = self._touch_y
+        slot = slots.get(int(getattr(ev, "finger_id", 0)))
+        if slot is not None:
+            xs[slot] = tx
+            ys[slot] = ty
+        order = self.touch_order
+        if len(order) >= 2:
+            s1 = slots[order[0]]
+            s2 = slots[order[1]]
+            x1, y1, x2, y2 = xs[s1], ys[s1], xs[s2], ys[s2]
+            mid_x = int((x1 + x2) / 2)
+            mid_y = int((y1 + y2) / 2)
+            dist = math.hypot(x1 - x2, y1 - y2)
+            if self.pinch_distance == 0.0:
+                self.pinch_distance = dist
+                self.pinch_zoom_start = self.zoom
+            else:
+                ratio = dist / max(1.0, self.pinch_distance)
+                self._set_zoom_around(self.pinch_zoom_start * ratio, mid_x, mid_y)
+            w, h = self._touch_scale
+            self._pan_camera(ev.dx * w, ev.dy * h)
+            self.pointer_down = False
 
     def _set_section(self, section: str) -> None:
         if section not in self.main_sections:
@@ -776,30 +1244,74 @@ class GameUI:
         self._set_section(self.main_sections[(idx + 1) % len(self.main_sections)])
 
     def _rd_visible_targets(self) -> List[str]:
+        # Available targets only change with the focus or the unlocked tech set.
+        key = (self.sim, self.sim.research_focus, tuple(self.sim.tech_tree.items()))
+        if self._rd_cache is not None and self._rd_cache[0] == key:
+            return list(self._rd_cache[1])
         targets = self.sim.available_research_targets()
         if self.sim.research_focus and self.sim.research_focus not in targets:
             targets.insert(0, self.sim.research_focus)
-        return targets[:3]
+        self._rd_cache = (key, targets[:3])
+        return list(self._rd_cache[1])
+
+    def _sync_unlock_meta(self) -> None:
+        if self._meta_unlocks_version != self.sim.unlocks_version:
+            self._orders_meta.clear()
+            self._commercials_meta.clear()
+            self._meta_unlocks_version = self.sim.unlocks_version
+
+    def _subsection_token(self, section: str) -> tuple:
+        if section == "Orders":
+            return (
+                self.sim,
+                tuple(self.sim.order_channel_is_unlocked(ORDERS_LABEL_TO_KEY[c]) for c in ORDER_CHANNEL_LABELS),
+            )
+        if section == "Commercials":
+            return (
+                self.sim,
+                tuple(self.sim.commercial_strategy_is_unlocked(COMMERCIALS_LABEL_TO_KEY[c]) for c in COMMERCIAL_STRATEGY_LABELS),
+            )
+        if section == "R&D":
+            return (self.sim, self.sim.research_focus, tuple(self.sim.tech_tree.items()))
+        return ()
 
     def _subsections_for(self, section: str) -> List[str]:
+        # Labels only change with the unlock state captured by the section token.
+        token = self._subsection_token(section)
+        cached = self._subsection_cache.get(section)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        labels = self._build_subsections(section)
+        self._subsection_cache[section] = (token, labels)
+        return labels
+
+    def _build_subsections(self, section: str) -> List[str]:
+        if section in ("Orders", "Commercials"):
+            self._sync_unlock_meta()
         if section == "Orders":
             labels: List[str] = []
             for channel in self.section_defaults.get("Orders", []):
-                key = channel.lower().replace("-", "_")
+                key = ORDERS_LABEL_TO_KEY[channel]
                 if self.sim.order_channel_is_unlocked(key):
                     labels.append(channel)
                 else:
-                    min_rep = int(self.sim.order_channel_min_reputation(key))
+                    min_rep = self._orders_meta.get(key)
+                    if min_rep is None:
+                        min_rep = int(self.sim.order_channel_min_reputation(key))
+                        self._orders_meta[key] = min_rep
                     labels.append(f"{channel} (Rep {min_rep})")
             return labels
         if section == "Commercials":
             labels: List[str] = []
             for strategy in self.section_defaults.get("Commercials", []):
-                key = strategy.lower()
+                key = COMMERCIALS_LABEL_TO_KEY[strategy]
                 if self.sim.commercial_strategy_is_unlocked(key):
                     labels.append(strategy)
                 else:
-                    required = str(self.simulation_commercials().get(key, {}).get("required_research", "")).strip()
+                    required = self._commercials_meta.get(key)
+                    if required is None:
+                        required = str(COMMERCIALS.get(key, {}).get("required_research", "")).strip()
+                        self._commercials_meta[key] = required
                     labels.append(f"{strategy} ({required})" if required else strategy)
             return labels
         if section != "R&D":
@@ -853,18 +1365,21 @@ class GameUI:
                     self._set_selected_build_tool(self.build_tool_configs[tool_key]["tile"])
             if self.active_section == "Orders":
                 label = subsection.split(" (", 1)[0]
-                requested_channel = label.lower().replace("-", "_")
+                requested_channel = ORDERS_LABEL_TO_KEY.get(label, "")
                 if self.sim.set_order_channel(requested_channel):
                     self.order_channel = requested_channel
                 else:
-                    selected_label = self.order_channel.replace("_", "-").title()
-                    self.active_subsection = selected_label
+                    self.active_subsection = ORDERS_KEY_TO_LABEL.get(self.order_channel) or (
+                        self.order_channel.replace("_", "-").title()
+                    )
             elif self.active_section == "Commercials":
-                strategy = subsection.split(" (", 1)[0].lower()
+                strategy = COMMERCIALS_LABEL_TO_KEY.get(subsection.split(" (", 1)[0], "")
                 if self.sim.set_commercial_strategy(strategy):
                     self.commercial_strategy = self.sim.commercial_strategy
                 else:
-                    self.active_subsection = self.commercial_strategy.title()
+                    self.active_subsection = COMMERCIALS_KEY_TO_LABEL.get(self.commercial_strategy) or (
+                        self.commercial_strategy.title()
+                    )
             elif self.active_section == "R&D":
                 if subsection == "Cycle":
                     self.sim.cycle_research_focus()
@@ -874,15 +1389,32 @@ class GameUI:
                     self.sim.set_research_focus("")
                 elif subsection.startswith("Focus: "):
                     self.sim.set_research_focus(subsection.split(": ", 1)[1])
+                self._rd_cache = None
                 if self.sim.research_focus:
                     self.active_subsection = f"Focus: {self.sim.research_focus}"
 
     def simulation_commercials(self) -> Dict[str, Dict[str, str | int | float]]:
-        from game.simulation import COMMERCIALS
-
         return COMMERCIALS
 
     def _ui_rects(self) -> Dict[str, List[Tuple[pygame.Rect, str]]]:
+        # Chip rects only move with the layout or the state that picks the chip labels.
+        key = (
+            self._layout_version,
+            self.bottom_sheet_state,
+            self.active_section,
+            tuple(self._subsections_for(self.active_section)),
+            self.selected,
+            self.row_mode_enabled,
+            self.placement_mode,
+            self.placement_mode != "idle" and self._can_confirm_pending(),
+        )
+        if self._ui_rects_cache is not None and self._ui_rects_cache[0] == key:
+            return self._ui_rects_cache[1]
+        rects = self._compute_ui_rects()
+        self._ui_rects_cache = (key, rects)
+        return rects
+
+    def _compute_ui_rects(self) -> Dict[str, List[Tuple[pygame.Rect, str]]]:
         assert self.layout is not None
         if self.layout.bottom_sheet_h <= 0 or self.bottom_sheet_state != "expanded":
             return {
@@ -893,7 +1425,7 @@ class GameUI:
                 "placement_actions": [],
             }
         top_y = self.layout.bottom_sheet_y + 8
-        sections = self._layout_chip_rows(
+        sections, sections_bottom = self._layout_chip_rows(
             self.main_sections,
             start_y=top_y,
             min_width=120 if self.touch_mode else 104,
@@ -902,8 +1434,8 @@ class GameUI:
             gap_y=8,
         )
 
-        sub_start = max(rect.bottom for rect, _ in sections) + 8 if sections else top_y
-        subs = self._layout_chip_rows(
+        sub_start = sections_bottom + 8 if sections else top_y
+        subs, subs_bottom = self._layout_chip_rows(
             self._subsections_for(self.active_section),
             start_y=sub_start,
             min_width=150 if self.touch_mode else 132,
@@ -919,7 +1451,7 @@ class GameUI:
         if self.active_section == "Build":
             allowed_rotations = self._allowed_rotations_for_selected()
             if len(allowed_rotations) > 1:
-                rot_start = max(rect.bottom for rect, _ in subs) + 6 if subs else sub_start
+                rot_start = subs_bottom + 6 if subs else sub_start
                 rot_chip_size = self.touch_target_min_h + 4
                 rot_chip_w = rot_chip_size + 8
                 total_rot_w = len(allowed_rotations) * rot_chip_w + (len(allowed_rotations) - 1) * 6
@@ -932,21 +1464,23 @@ class GameUI:
                 # Row mode toggle - positioned after rotation chips
                 toggle_x = rot_x + 14
                 toggle_label = self._row_mode_label()
-                text_w, _ = self.chip_font.size(toggle_label)
+                text_w, _ = self._chip_text_size(toggle_label)
                 toggle_w = max(100 if self.touch_mode else 80, text_w + self.touch_horizontal_padding * 2)
                 row_toggle.append((pygame.Rect(toggle_x, rot_start, toggle_w, rot_chip_size), toggle_label))
 
             # Placement action buttons when in active placement
             if self.placement_mode != "idle":
-                base_rects = rotation_row or subs
-                action_start = max(rect.bottom for rect, _ in base_rects) + 6 if base_rects else sub_start
+                if rotation_row:
+                    action_start = rot_start + rot_chip_size + 6
+                else:
+                    action_start = subs_bottom + 6 if subs else sub_start
                 action_labels = []
                 action_labels.append("Cancel")
                 if self._can_confirm_pending():
                     action_labels.append("Confirm")
                 else:
                     action_labels.append("Confirm (blocked)")
-                placement_actions = self._layout_chip_rows(
+                placement_actions, _ = self._layout_chip_rows(
                     action_labels,
                     start_y=action_start,
                     min_width=140 if self.touch_mode else 110,
@@ -964,9 +1498,27 @@ class GameUI:
         }
 
     def _toolbar_rects(self) -> List[Tuple[pygame.Rect, str]]:
+        ui_rects = self._ui_rects()
+        assert self._ui_rects_cache is not None
+        key = (self._ui_rects_cache[0], self._active_toolbar_actions())
+        if self._toolbar_rects_cache is not None and self._toolbar_rects_cache[0] == key:
+            return self._toolbar_rects_cache[1]
+        rects, bottom = self._compute_toolbar_rects(ui_rects)
+        self._toolbar_rects_cache = (key, rects, bottom)
+        return rects
+
+    def _toolbar_bottom(self) -> int:
+        """Lowest toolbar chip edge for the current layout; only meaningful when there are chips."""
+        self._toolbar_rects()
+        assert self._toolbar_rects_cache is not None
+        return self._toolbar_rects_cache[2]
+
+    def _compute_toolbar_rects(
+        self, ui_rects: Dict[str, List[Tuple[pygame.Rect, str]]]
+    ) -> Tuple[List[Tuple[pygame.Rect, str]], int]:
         assert self.layout is not None
         if self.layout.bottom_sheet_h <= 0:
-            return []
+            return [], self.layout.bottom_sheet_y
         if self.bottom_sheet_state == "compact":
             return self._layout_chip_rows(
                 [self._row_mode_label(), "1 Conveyor", "2 Processor", "3 Oven", "5 Delete"],
@@ -978,7 +1530,6 @@ class GameUI:
                 label_fn=self._toolbar_button_label,
             )
 
-        ui_rects = self._ui_rects()
         # Find the lowest UI element to position toolbar below
         all_rects = (
             ui_rects.get("placement_actions", [])
@@ -999,230 +1550,308 @@ class GameUI:
             label_fn=self._toolbar_button_label,
         )
 
+    def _toolbar_tool_for(self, label: str) -> str | None:
+        if label not in self._toolbar_tool_cache:
+            tool = next((kind for word, kind in TOOLBAR_TOOL_WORDS if word in label), None)
+            self._toolbar_tool_cache[label] = tool
+        return self._toolbar_tool_cache[label]
+
     def _expanded_hit_rect(self, rect: pygame.Rect) -> pygame.Rect:
         return rect.inflate(self.hit_slop * 2, self.hit_slop * 2)
 
-    def _active_toolbar_actions(self) -> List[str]:
+    def _active_toolbar_actions(self) -> Tuple[str, ...]:
         if self.active_section == "Build":
-            base_actions = list(
-                self.build_toolbar_actions.get(
-                    self.active_subsection,
-                    ["S Save", "L Load", "C Cycle R&D", "U Unlock"],
-                )
-            )
-            return base_actions
-        return list(self.toolbar_actions)
+            return self.build_toolbar_actions.get(self.active_subsection, self.default_build_toolbar_actions)
+        return self.toolbar_actions
 
-    def _handle_toolbar_action(self, label: str) -> bool:
-        if label == "Cancel":
-            self._clear_pending_placement()
-        elif label == "Confirm":
-            if not self._can_confirm_pending():
-                self.status_message = "Placement blocked: adjust selection or cancel"
-                return True
-            self._commit_pending_placement()
-        elif label.startswith("Row: "):
-            self._toggle_row_mode()
-        elif label == "1 Conveyor":
-            self._set_selected_build_tool(CONVEYOR, "Conveyor")
-        elif label == "2 Processor":
-            self._set_selected_build_tool(PROCESSOR, "Processor")
-        elif label == "3 Oven":
-            self._set_selected_build_tool(OVEN, "Oven")
-        elif label == "4 Bot Dock":
-            self._set_selected_build_tool(BOT_DOCK, "Bot Dock")
-        elif label == "6 Assembly":
-            self._set_selected_build_tool(ASSEMBLY_TABLE, "Assembly")
-        elif label == "5 Delete":
-            self._set_selected_build_tool(EMPTY)
-        elif label == "Rot -":
-            self._step_rotation(-1)
-        elif label == "Rot +":
-            self._step_rotation(1)
-        elif label == "C Cycle R&D":
-            self.sim.cycle_research_focus()
-        elif label == "U Unlock":
-            self.sim.try_unlock_research_focus()
-        elif label == "S Save":
-            self.sim.save()
-            self._save_ui_settings()
-        elif label == "L Load" and SAVE_FILE.exists():
-            self.sim = FactorySim.load()
-            self.order_channel = self.sim.order_channel
-            self.commercial_strategy = self.sim.commercial_strategy
-            self._load_ui_settings()
-            self._reflow_layout()
-            self._clear_pending_placement()
-        else:
+    def _toolbar_confirm(self) -> None:
+        if not self._can_confirm_pending():
+            self.status_message = "Placement blocked: adjust selection or cancel"
+            return
+        self._commit_pending_placement()
+
+    def _toolbar_cycle_research(self) -> None:
+        self.sim.cycle_research_focus()
+        self._rd_cache = None
+
+    def _toolbar_unlock_research(self) -> None:
+        self.sim.try_unlock_research_focus()
+        self._rd_cache = None
+
+    def _toolbar_save(self) -> None:
+        self.sim.save()
+        self._save_ui_settings()
+
+    def _toolbar_load(self) -> bool:
+        if not SAVE_FILE.exists():
             return False
+        self._end_sim_batch()
+        self.sim = FactorySim.load()
+        self._meta_unlocks_version = -1
+        self.order_channel = self.sim.order_channel
+        self.commercial_strategy = self.sim.commercial_strategy
+        self._load_ui_settings()
+        self._reflow_layout()
+        self._clear_pending_placement()
         return True
 
+    def _handle_toolbar_action(self, label: str) -> bool:
+        handler = self._toolbar_dispatch.get(label)
+        if handler is None:
+            if not label.startswith("Row: "):
+                return False
+            handler = self._toggle_row_mode
+        return handler() is not False
+
+    def _hit_table(self) -> Tuple[List[int], List[tuple]]:
+        """Inflated hit rects for every clickable chip, sorted by top edge.
+
+        Entries are ``(top, bottom, left, right, priority, kind, value)``; lower
+        priority wins where inflated rects overlap, matching the draw order.
+        """
+        ui_rects = self._ui_rects()
+        toolbar_rects = self._toolbar_rects()
+        cached = self._hit_table_cache
+        if cached is not None and cached[0] == self._layout_version and cached[1] is ui_rects and cached[2] is toolbar_rects:
+            return cached[3], cached[4]
+        sidebar = [(self.sidebar_toggle_rect, "")] if self.sidebar_toggle_rect else []
+        groups = (
+            ("hud", self.hud_toggle_rects),
+            ("sidebar", sidebar),
+            ("section", ui_rects["sections"]),
+            ("subsection", ui_rects["subsections"]),
+            ("rotation", ui_rects["tool_rotations"]),
+            ("row_toggle", ui_rects.get("row_toggle", [])),
+            ("placement", ui_rects.get("placement_actions", [])),
+            ("toolbar", toolbar_rects),
+        )
+        slop = self.hit_slop
+        entries: List[tuple] = []
+        for kind, rects in groups:
+            for rect, value in rects:
+                entries.append((rect.top - slop, rect.bottom + slop, rect.left - slop, rect.right + slop, len(entries), kind, value))
+        entries.sort()
+        tops = [entry[0] for entry in entries]
+        self._hit_table_cache = (self._layout_version, ui_rects, toolbar_rects, tops, entries)
+        return tops, entries
+
     def _handle_click(self, mx: int, my: int) -> bool:
-        for rect, action in self.hud_toggle_rects:
-            if self._expanded_hit_rect(rect).collidepoint(mx, my):
-                if action == "sheet":
-                    self._cycle_bottom_sheet_state()
-                elif action == "kpis":
-                    self.show_top_kpis = not self.show_top_kpis
-                    self._save_ui_settings()
-                    self._reflow_layout()
-                elif action == "dock":
-                    self.show_floating_dock = not self.show_floating_dock
-                    self._save_ui_settings()
-                elif action.startswith("tool:"):
-                    return self._handle_toolbar_action(action.split(":", 1)[1])
-                return True
-
-        if self.sidebar_toggle_rect and self._expanded_hit_rect(self.sidebar_toggle_rect).collidepoint(mx, my):
+        tops, entries = self._hit_table()
+        hit = None
+        for top, bottom, left, right, priority, kind, value in entries[: bisect_right(tops, my)]:
+            if my >= bottom or not left <= mx < right:
+                continue
+            if hit is not None and priority > hit[0]:
+                continue
+            if kind == "toolbar" and value == "Confirm" and not self._can_confirm_pending():
+                continue
+            hit = (priority, kind, value)
+        if hit is None:
+            return False
+        _, kind, value = hit
+
+        if kind == "hud":
+            if value == "sheet":
+                self._cycle_bottom_sheet_state()
+            elif value == "kpis":
+                self.show_top_kpis = not self.show_top_kpis
+                self._save_ui_settings()
+                self._reflow_layout()
+            elif value == "dock":
+                self.show_floating_dock = not self.show_floating_dock
+                self._save_ui_settings()
+            elif value.startswith("tool:"):
+                return self._handle_toolbar_action(value.split(":", 1)[1])
+            return True
+        if kind == "sidebar":
             self.sidebar_visible = not self.sidebar_visible
             self._save_ui_settings()
             self._reflow_layout()
             return True
+        if kind == "section":
+            self._set_section(value)
+            return True
+        if kind == "subsection":
+            self._set_subsection(value)
+            return True
+        if kind == "rotation":
+            self._set_rotation(int(value))
+            return True
+        if kind == "row_toggle":
+            self._toggle_row_mode()
+            return True
+        if kind == "placement":
+            if value == "Cancel":
+                self._clear_pending_placement()
+            elif value == "Confirm" and self._can_confirm_pending():
+                self._commit_pending_placement()
+            elif value.startswith("Confirm"):
+                self.status_message = "Placement blocked: adjust selection or cancel"
+            return True
+        return self._handle_toolbar_action(value)
+
+    def _flush_mouse_motion(self, rel_x: float, rel_y: float) -> None:
+        x, y = pygame.mouse.get_pos()
+        self._handle_pointer_move(x, y, rel_x, rel_y)
+
+    def _build_event_dispatch(self) -> Dict[int, Callable[[object], None]]:
+        dispatch: Dict[int, Callable[[object], None]] = {
+            pygame.QUIT: self._on_quit,
+            pygame.VIDEORESIZE: self._on_video_resize,
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+            pygame.FINGERDOWN: self._on_finger_down,
+            pygame.FINGERMOTION: self._on_finger_motion,
+            pygame.FINGERUP: self._on_finger_up,
+        }
+        if hasattr(pygame, "WINDOWSIZECHANGED"):
+            dispatch[pygame.WINDOWSIZECHANGED] = self._on_window_size_changed
+        # Exposure only needs the redraw that every handled event already requests.
+        for name in ("VIDEOEXPOSE", "WINDOWEXPOSED"):
+            if hasattr(pygame, name):
+                dispatch[getattr(pygame, name)] = self._on_expose
+        return dispatch
+
+    def _on_quit(self, ev) -> None:
+        self.running = False
+
+    def _on_video_resize(self, ev) -> None:
+        if self.display_mode == "desktop_windowed":
+            self.screen = pygame.display.set_mode((ev.w, ev.h), pygame.RESIZABLE)
+            self._reflow_layout(ev.w, ev.h)
+
+    def _on_window_size_changed(self, ev) -> None:
+        self._reflow_layout(*self.screen.get_size())
 
-        ui_rects = self._ui_rects()
-        for rect, section in ui_rects["sections"]:
-            if self._expanded_hit_rect(rect).collidepoint(mx, my):
-                self._set_section(section)
-                return True
-        for rect, subsection in ui_rects["subsections"]:
-            if self._expanded_hit_rect(rect).collidepoint(mx, my):
-                self._set_subsection(subsection)
-                return True
-        for rect, rotation in ui_rects["tool_rotations"]:
-            if self._expanded_hit_rect(rect).collidepoint(mx, my):
-                self._set_rotation(int(rotation))
-                return True
-        for rect, label in ui_rects.get("row_toggle", []):
-            if self._expanded_hit_rect(rect).collidepoint(mx, my):
-                self._toggle_row_mode()
-                return True
-        for rect, label in ui_rects.get("placement_actions", []):
-            if self._expanded_hit_rect(rect).collidepoint(mx, my):
-                if label == "Cancel":
-                    self._clear_pending_placement()
-                elif label == "Confirm" and self._can_confirm_pending():
-                    self._commit_pending_placement()
-                elif label.startswith("Confirm"):
-                    self.status_message = "Placement blocked: adjust selection or cancel"
-                return True
-        for rect, label in self._toolbar_rects():
-            if label == "Confirm" and not self._can_confirm_pending():
-                continue
-            if self._expanded_hit_rect(rect).collidepoint(mx, my):
-                return self._handle_toolbar_action(label)
-        return False
+    def _on_expose(self, ev) -> None:
+        pass
+
+    def _build_key_actions(self) -> Dict[int, Callable[[], object]]:
+        def select(tile: str) -> Callable[[], None]:
+            return lambda: setattr(self, "selected", tile)
+
+        def toolbar(label: str) -> Callable[[], bool]:
+            return lambda: self._handle_toolbar_action(label)
+
+        def section(name: str) -> Callable[[], None]:
+            return lambda: self._set_section(name)
+
+        return {
+            pygame.K_1: select(CONVEYOR),
+            pygame.K_2: select(PROCESSOR),
+            pygame.K_3: select(OVEN),
+            pygame.K_4: select(BOT_DOCK),
+            pygame.K_6: select(ASSEMBLY_TABLE),
+            pygame.K_5: select(EMPTY),
+            pygame.K_r: toolbar("Rot +"),
+            pygame.K_e: toolbar("Rot +"),
+            pygame.K_q: toolbar("Rot -"),
+            pygame.K_TAB: self._cycle_section,
+            pygame.K_F1: section("Build"),
+            pygame.K_F2: section("Orders"),
+            pygame.K_F3: section("R&D"),
+            pygame.K_F4: section("Commercials"),
+            pygame.K_F5: section("Info"),
+            pygame.K_s: toolbar("S Save"),
+            pygame.K_c: toolbar("C Cycle R&D"),
+            pygame.K_u: toolbar("U Unlock"),
+            pygame.K_l: toolbar("L Load"),
+            pygame.K_h: self._cycle_bottom_sheet_state,
+            pygame.K_F6: self._toggle_top_kpis,
+            pygame.K_F7: self._toggle_sidebar,
+        }
+
+    def _toggle_top_kpis(self) -> None:
+        self.show_top_kpis = not self.show_top_kpis
+        self._save_ui_settings()
+        self._reflow_layout()
+
+    def _toggle_sidebar(self) -> None:
+        self.sidebar_visible = not self.sidebar_visible
+        self._save_ui_settings()
+        self._reflow_layout()
+
+    def _on_key_down(self, ev) -> None:
+        if self.touch_mode:
+            return
+        action = self._key_actions.get(ev.key)
+        if action is not None:
+            action()
+
+    def _on_mouse_button_down(self, ev) -> None:
+        if ev.button != 1:
+            return
+        x, y = pygame.mouse.get_pos()
+        if self.context_menu_cell is not None and self._handle_context_menu_click(x, y):
+            return
+        self._handle_pointer_down(x, y)
+
+    def _on_mouse_button_up(self, ev) -> None:
+        if ev.button != 1:
+            return
+        x, y = pygame.mouse.get_pos()
+        self._handle_pointer_up(x, y)
+
+    def _on_mouse_wheel(self, ev) -> None:
+        x, y = pygame.mouse.get_pos()
+        zoom_step = 1.0 + (ev.y * 0.08)
+        self._set_zoom_around(self.zoom * zoom_step, x, y)
+
+    def _on_finger_down(self, ev) -> None:
+        self._update_touch_tracking(ev, True)
+        tx, ty = self._touch_to_screen(ev)
+        if len(self.touch_order) == 1:
+            self._handle_pointer_down(tx, ty)
+        elif len(self.touch_order) >= 2:
+            self.pointer_down = False
+            self._end_sim_batch()
+
+    def _on_finger_motion(self, ev) -> None:
+        if len(self.touch_order) >= 2:
+            self._handle_touch_motion(ev)
+        else:
+            tx, ty = self._touch_to_screen(ev)
+            w, h = self._touch_scale
+            self._handle_pointer_move(tx, ty, ev.dx * w, ev.dy * h)
+
+    def _on_finger_up(self, ev) -> None:
+        tx, ty = self._touch_to_screen(ev)
+        if len(self.touch_order) < 2:
+            self._handle_pointer_up(tx, ty)
+        self._update_touch_tracking(ev, False)
+        if len(self.touch_order) < 2:
+            self.pinch_distance = 0.0
 
     def handle_input(self) -> None:
+        # Consecutive MOUSEMOTION events are coalesced into one pointer move
+        # with the summed delta; it is flushed before any other event so
+        # ordering against button presses is preserved.
+        dispatch = self._event_dispatch
+        motion_type = pygame.MOUSEMOTION
+        motion_rel: List[float] | None = None
         for ev in pygame.event.get():
-            if ev.type == pygame.QUIT:
-                self.running = False
-            if ev.type == pygame.VIDEORESIZE and self.display_mode == "desktop_windowed":
-                self.screen = pygame.display.set_mode((ev.w, ev.h), pygame.RESIZABLE)
-                self._reflow_layout(ev.w, ev.h)
-            if hasattr(pygame, "WINDOWSIZECHANGED") and ev.type == pygame.WINDOWSIZECHANGED:
-                self._reflow_layout(*self.screen.get_size())
-            if ev.type == pygame.KEYDOWN:
-                if self.touch_mode:
-                    continue
-                if ev.key == pygame.K_1:
-                    self.selected = CONVEYOR
-                elif ev.key == pygame.K_2:
-                    self.selected = PROCESSOR
-                elif ev.key == pygame.K_3:
-                    self.selected = OVEN
-                elif ev.key == pygame.K_4:
-                    self.selected = BOT_DOCK
-                elif ev.key == pygame.K_6:
-                    self.selected = ASSEMBLY_TABLE
-                elif ev.key == pygame.K_5:
-                    self.selected = EMPTY
-                elif ev.key == pygame.K_r or ev.key == pygame.K_e:
-                    self._handle_toolbar_action("Rot +")
-                elif ev.key == pygame.K_q:
-                    self._handle_toolbar_action("Rot -")
-                elif ev.key == pygame.K_TAB:
-                    self._cycle_section()
-                elif ev.key == pygame.K_F1:
-                    self._set_section("Build")
-                elif ev.key == pygame.K_F2:
-                    self._set_section("Orders")
-                elif ev.key == pygame.K_F3:
-                    self._set_section("R&D")
-                elif ev.key == pygame.K_F4:
-                    self._set_section("Commercials")
-                elif ev.key == pygame.K_F5:
-                    self._set_section("Info")
-                elif ev.key == pygame.K_s:
-                    self._handle_toolbar_action("S Save")
-                elif ev.key == pygame.K_c:
-                    self._handle_toolbar_action("C Cycle R&D")
-                elif ev.key == pygame.K_u:
-                    self._handle_toolbar_action("U Unlock")
-                elif ev.key == pygame.K_l:
-                    self._handle_toolbar_action("L Load")
-                elif ev.key == pygame.K_h:
-                    self._cycle_bottom_sheet_state()
-                elif ev.key == pygame.K_F6:
-                    self.show_top_kpis = not self.show_top_kpis
-                    self._save_ui_settings()
-                    self._reflow_layout()
-                elif ev.key == pygame.K_F7:
-                    self.sidebar_visible = not self.sidebar_visible
-                    self._save_ui_settings()
-                    self._reflow_layout()
-            if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                x, y = pygame.mouse.get_pos()
-                if self.context_menu_cell is not None and self._handle_context_menu_click(x, y):
-                    continue
-                self._handle_pointer_down(x, y)
-            if ev.type == pygame.MOUSEMOTION:
-                x, y = pygame.mouse.get_pos()
-                self._handle_pointer_move(x, y, ev.rel[0], ev.rel[1])
-            if ev.type == pygame.MOUSEBUTTONUP and ev.button == 1:
-                x, y = pygame.mouse.get_pos()
-                self._handle_pointer_up(x, y)
-            if ev.type == pygame.MOUSEWHEEL:
-                x, y = pygame.mouse.get_pos()
-                zoom_step = 1.0 + (ev.y * 0.08)
-                self._set_zoom_around(self.zoom * zoom_step, x, y)
-            if ev.type == pygame.FINGERDOWN:
-                self._update_touch_tracking(ev, True)
-                tx, ty = self._touch_to_screen(ev)
-                if len(self.touch_order) == 1:
-                    self._handle_pointer_down(tx, ty)
-                elif len(self.touch_order) >= 2:
-                    self.pointer_down = False
-            if ev.type == pygame.FINGERMOTION:
-                if len(self.touch_order) >= 2:
-                    self._handle_touch_motion(ev)
-                else:
-                    tx, ty = self._touch_to_screen(ev)
-                    rel_x = ev.dx * self.layout.viewport_w
-                    rel_y = ev.dy * self.layout.viewport_h
-                    self._handle_pointer_move(tx, ty, rel_x, rel_y)
-            if ev.type == pygame.FINGERUP:
-                tx, ty = self._touch_to_screen(ev)
-                if len(self.touch_order) < 2:
-                    self._handle_pointer_up(tx, ty)
-                self._update_touch_tracking(ev, False)
-                if len(self.touch_order) < 2:
-                    self.pinch_distance = 0.0
+            self._dirty = True
+            if ev.type == motion_type:
+                if motion_rel is None:
+                    motion_rel = [0.0, 0.0]
+                motion_rel[0] += ev.rel[0]
+                motion_rel[1] += ev.rel[1]
+                continue
+            if motion_rel is not None:
+                self._flush_mouse_motion(*motion_rel)
+                motion_rel = None
+            handler = dispatch.get(ev.type)
+            if handler is not None:
+                handler(ev)
+        if motion_rel is not None:
+            self._flush_mouse_motion(*motion_rel)
 
     def _tile_base_color(self, kind: str) -> Tuple[int, int, int]:
-        colors = {
-            EMPTY: (40, 44, 58),
-            CONVEYOR: (74, 126, 230),
-            MACHINE: (208, 158, 80),
-            PROCESSOR: (230, 190, 102),
-            OVEN: (232, 102, 61),
-            BOT_DOCK: (98, 211, 222),
-            ASSEMBLY_TABLE: (162, 110, 220),
-            SOURCE: (88, 193, 112),
-            SINK: (196, 98, 96),
-        }
-        return colors.get(kind, (100, 100, 100))
+        return TILE_BASE_COLORS.get(kind, UNKNOWN_TILE_COLOR)
 
-    def _draw_tile_icon(self, tile, rect: pygame.Rect) -> None:
+    def _draw_tile_icon(self, surface: pygame.Surface, kind: str, rot: int, rect: pygame.Rect) -> None:
         cx, cy = rect.center
         icon = (242, 246, 255)
         scale = self.tile_icon_scale * max(0.72, min(1.28, rect.w / 44.0))
@@ -1230,54 +1859,54 @@ class GameUI:
         def px(value: float) -> int:
             return max(1, int(round(value * scale)))
 
-        if tile.kind in (CONVEYOR, SOURCE):
-            dx, dy = DIRS[tile.rot]
+        if kind in (CONVEYOR, SOURCE):
+            dx, dy = DIRS[rot]
             tip = (cx + dx * px(14), cy + dy * px(14))
             side = (dy * px(9), -dx * px(9))
             base = (cx - dx * px(8), cy - dy * px(8))
             points = [tip, (base[0] + side[0], base[1] + side[1]), (base[0] - side[0], base[1] - side[1])]
-            pygame.draw.polygon(self.screen, icon, points)
-        elif tile.kind == PROCESSOR:
+            pygame.draw.polygon(surface, icon, points)
+        elif kind == PROCESSOR:
             chip = pygame.Rect(0, 0, px(19), px(19))
             chip.center = (cx, cy)
-            pygame.draw.rect(self.screen, icon, chip, width=max(2, px(2)), border_radius=px(4))
+            pygame.draw.rect(surface, icon, chip, width=max(2, px(2)), border_radius=px(4))
             for off in (-7, -3, 1, 5):
                 y = cy + px(off)
-                pygame.draw.line(self.screen, icon, (chip.left - px(4), y), (chip.left, y), max(2, px(2)))
-                pygame.draw.line(self.screen, icon, (chip.right, y), (chip.right + px(4), y), max(2, px(2)))
-        elif tile.kind == OVEN:
-            pygame.draw.circle(self.screen, icon, (cx, cy + px(5)), px(10), width=max(2, px(2)))
+                pygame.draw.line(surface, icon, (chip.left - px(4), y), (chip.left, y), max(2, px(2)))
+                pygame.draw.line(surface, icon, (chip.right, y), (chip.right + px(4), y), max(2, px(2)))
+        elif kind == OVEN:
+            pygame.draw.circle(surface, icon, (cx, cy + px(5)), px(10), width=max(2, px(2)))
             flame = [(cx, cy - px(8)), (cx - px(7), cy + px(3)), (cx, cy), (cx + px(7), cy + px(3))]
-            pygame.draw.polygon(self.screen, icon, flame)
-        elif tile.kind == BOT_DOCK:
-            pygame.draw.circle(self.screen, icon, (cx, cy - px(3)), px(9), width=max(2, px(2)))
-            pygame.draw.circle(self.screen, icon, (cx - px(3), cy - px(4)), max(1, px(1)))
-            pygame.draw.circle(self.screen, icon, (cx + px(3), cy - px(4)), max(1, px(1)))
-            pygame.draw.rect(self.screen, icon, (cx - px(10), cy + px(8), px(20), max(2, px(3))), border_radius=px(2))
-        elif tile.kind == ASSEMBLY_TABLE:
+            pygame.draw.polygon(surface, icon, flame)
+        elif kind == BOT_DOCK:
+            pygame.draw.circle(surface, icon, (cx, cy - px(3)), px(9), width=max(2, px(2)))
+            pygame.draw.circle(surface, icon, (cx - px(3), cy - px(4)), max(1, px(1)))
+            pygame.draw.circle(surface, icon, (cx + px(3), cy - px(4)), max(1, px(1)))
+            pygame.draw.rect(surface, icon, (cx - px(10), cy + px(8), px(20), max(2, px(3))), border_radius=px(2))
+        elif kind == ASSEMBLY_TABLE:
             pygame.draw.rect(
-                self.screen,
+                surface,
                 icon,
                 pygame.Rect(cx - px(13), cy - px(4), px(26), px(12)),
                 width=max(2, px(2)),
                 border_radius=px(3),
             )
             pygame.draw.line(
-                self.screen, icon, (cx - px(9), cy + px(8)), (cx - px(9), cy + px(14)), max(2, px(2))
+                surface, icon, (cx - px(9), cy + px(8)), (cx - px(9), cy + px(14)), max(2, px(2))
             )
             pygame.draw.line(
-                self.screen, icon, (cx + px(9), cy + px(8)), (cx + px(9), cy + px(14)), max(2, px(2))
+                surface, icon, (cx + px(9), cy + px(8)), (cx + px(9), cy + px(14)), max(2, px(2))
             )
-        elif tile.kind == SINK:
-            pygame.draw.circle(self.screen, icon, (cx, cy), px(11), width=max(2, px(2)))
-            pygame.draw.circle(self.screen, icon, (cx, cy), px(4))
+        elif kind == SINK:
+            pygame.draw.circle(surface, icon, (cx, cy), px(11), width=max(2, px(2)))
+            pygame.draw.circle(surface, icon, (cx, cy), px(4))
 
     def _draw_metric_card(self, x: int, y: int, w: int, title: str, value: float, hue: Tuple[int, int, int]) -> None:
         card = pygame.Rect(x, y, w, 54)
         pygame.draw.rect(self.screen, (27, 34, 48), card, border_radius=10)
         pygame.draw.rect(self.screen, (56, 68, 94), card, width=1, border_radius=10)
-        self.screen.blit(self.small.render(title, True, self.palette["muted"]), (x + 10, y + 8))
-        self.screen.blit(self.font.render(f"{value:5.1f}%", True, self.palette["text"]), (x + 10, y + 23))
+        self.screen.blit(self._text(title, self.palette["muted"]), (x + 10, y + 8))
+        self.screen.blit(self._render(self.font, f"{value:5.1f}%", self.palette["text"]), (x + 10, y + 23))
         bar_bg = pygame.Rect(x + 96, y + 25, w - 108, 16)
         pygame.draw.rect(self.screen, (43, 49, 63), bar_bg, border_radius=8)
         fill_w = int(bar_bg.w * max(0.0, min(1.0, value / 100.0)))
@@ -1285,6 +1914,12 @@ class GameUI:
         pygame.draw.rect(self.screen, hue, fill, border_radius=8)
 
     def _draw_chip(self, rect: pygame.Rect, label: str, active: bool, style: str = "default") -> None:
+        self.screen.blits(self._chip_blits(rect, label, active, style), doreturn=False)
+
+    def _chip_blits(
+        self, rect: pygame.Rect, label: str, active: bool, style: str = "default"
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return the ``(surface, dest)`` pairs that draw one chip, for batching into ``blits``."""
         bg = self.palette["chip_active"] if active else self.palette["chip"]
         border = self.palette["chip_active_border"] if active else self.palette["panel_border"]
         label_color = (255, 255, 255) if active else self.palette["text"]
@@ -1303,22 +1938,52 @@ class GameUI:
             border = (60, 64, 75)
             label_color = (100, 105, 120)
 
-        pygame.draw.rect(self.screen, bg, rect, border_radius=radius)
-        pygame.draw.rect(self.screen, border, rect, width=2 if active else 1, border_radius=radius)
-        shown = self._toolbar_button_label(label)
-        text = self.chip_font.render(shown, True, label_color)
-        text_rect = text.get_rect(center=rect.center)
-        self.screen.blit(text, text_rect)
+        key = (label, active, style, rect.w, rect.h)
+        cached = self._chip_cache.get(key)
+        if cached is None:
+            local = pygame.Rect(0, 0, rect.w, rect.h)
+            chip = pygame.Surface(local.size, pygame.SRCALPHA)
+            pygame.draw.rect(chip, bg, local, border_radius=radius)
+            pygame.draw.rect(chip, border, local, width=2 if active else 1, border_radius=radius)
+            text: pygame.Surface | None = self.chip_font.render(self._toolbar_button_label(label), True, label_color)
+            text_rect = text.get_rect(center=local.center)
+            # Labels wider than the chip are blitted separately so the overhang is not clipped.
+            if local.contains(text_rect):
+                chip.blit(text, text_rect)
+                text = None
+            cached = (chip.convert_alpha(), text)
+            self._chip_cache[key] = cached
+        chip, text = cached
+        if text is None:
+            return [(chip, rect.topleft)]
+        return [(chip, rect.topleft), (text, text.get_rect(center=rect.center).topleft)]
 
     def _draw_rotation_chip(self, rect: pygame.Rect, rot_value: int, active: bool) -> None:
         """Draw a rotation chip with a directional arrow icon."""
+        key = (rot_value, active, rect.w, rect.h)
+        cached = self._rotation_chip_cache.get(key)
+        if cached is None:
+            cached = self._render_rotation_chip(rot_value, active, rect.w, rect.h)
+            self._rotation_chip_cache[key] = cached
+        chip, overflow = cached
+        self.screen.blit(chip, rect.topleft)
+        if overflow is not None:
+            label_text, (ox, oy) = overflow
+            self.screen.blit(label_text, (rect.x + ox, rect.y + oy))
+
+    def _render_rotation_chip(
+        self, rot_value: int, active: bool, w: int, h: int
+    ) -> Tuple[pygame.Surface, Tuple[pygame.Surface, Tuple[int, int]] | None]:
+        """Rasterise a rotation chip; a label wider than the chip is returned separately with its offset."""
         bg = self.palette["chip_active"] if active else self.palette["chip"]
         border = self.palette["chip_active_border"] if active else self.palette["panel_border"]
         icon_color = (255, 255, 255) if active else self.palette["text"]
         radius = 14 if self.touch_mode else 9
 
-        pygame.draw.rect(self.screen, bg, rect, border_radius=radius)
-        pygame.draw.rect(self.screen, border, rect, width=2 if active else 1, border_radius=radius)
+        rect = pygame.Rect(0, 0, w, h)
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, bg, rect, border_radius=radius)
+        pygame.draw.rect(surface, border, rect, width=2 if active else 1, border_radius=radius)
 
         # Draw directional arrow icon
         cx, cy = rect.center
@@ -1340,17 +2005,22 @@ class GameUI:
             (tip_x - dx * int(arrow_size * 0.7) + side_x, tip_y - dy * int(arrow_size * 0.7) + side_y),
             (tip_x - dx * int(arrow_size * 0.7) - side_x, tip_y - dy * int(arrow_size * 0.7) - side_y),
         ]
-        pygame.draw.polygon(self.screen, icon_color, points)
+        pygame.draw.polygon(surface, icon_color, points)
         # Arrow shaft
         shaft_w = max(2, int(arrow_size * 0.3))
-        pygame.draw.line(self.screen, icon_color, (cx, cy), (base_x, base_y), shaft_w)
+        pygame.draw.line(surface, icon_color, (cx, cy), (base_x, base_y), shaft_w)
 
         # Draw small label below arrow
+        overflow = None
         label = self.rotation_chip_labels.get(rot_value, "")
-        label_text = self.small.render(label, True, icon_color)
+        label_text = self._text(label, icon_color)
         label_rect = label_text.get_rect(centerx=cx, top=cy + arrow_size + 3)
         if label_rect.bottom <= rect.bottom - 2:
-            self.screen.blit(label_text, label_rect)
+            if rect.contains(label_rect):
+                surface.blit(label_text, label_rect)
+            else:
+                overflow = (label_text, label_rect.topleft)
+        return surface.convert_alpha(), overflow
 
     def _draw_build_tool_icon(self, rect: pygame.Rect, tool_key: str, active: bool) -> None:
         """Draw a small icon on a build tool chip."""
@@ -1391,34 +2061,63 @@ class GameUI:
         if not self.landscape:
             return
 
-        toggle = pygame.Rect(self.layout.play_w - 24, 12, 22, 54)
-        self.sidebar_toggle_rect = toggle
+        toggle = self.sidebar_toggle_rect
+        assert toggle is not None
         self._draw_chip(toggle, ">" if not self.sidebar_visible else "<", self.sidebar_visible)
 
         if self.layout.side_panel_w <= 0:
             return
 
-        panel = pygame.Rect(self.layout.play_w, 0, self.layout.side_panel_w, self.layout.viewport_h)
-        pygame.draw.rect(self.screen, (16, 21, 33), panel)
-        pygame.draw.line(
-            self.screen,
-            self.palette["panel_border"],
-            (self.layout.play_w, 0),
-            (self.layout.play_w, self.layout.viewport_h),
-            2,
+        # Everything in the sidebar is a function of these values, so an unchanged
+        # key replays the last rendered sidebar as a single blit.
+        if self.active_section == "Info" and self.active_subsection == "Logs":
+            detail = tuple(self.sim.event_log[-4:])
+        elif self.active_section == "Info" and self.active_subsection == "Economy":
+            detail = tuple(self.sim.channel_stats_rows()[:3])
+        else:
+            detail = ()
+        sidebar_state = (
+            self._layout_version,
+            self.sim.money,
+            len(self.sim.orders),
+            round(self.sim.ontime_rate, 1),
+            len(self.sim.deliveries),
+            self.sim.bottleneck,
+            self.sim.hygiene,
+            self.active_section,
+            self.active_subsection,
+            detail,
         )
+        if self._sidebar_cache is not None and self._sidebar_cache_key == sidebar_state:
+            self.screen.blit(self._sidebar_cache, (self.layout.play_w, 0))
+            return
+
+        if self._sidebar_shell is None:
+            self._sidebar_shell = self._build_sidebar_shell()
+        self.screen.blit(self._sidebar_shell, (self.layout.play_w, 0))
 
         y = 14
-        self.screen.blit(self.font.render("Operations", True, self.palette["text"]), (self.layout.play_w + 14, y))
+        self.screen.blit(self._render(self.font, "Operations", self.palette["text"]), (self.layout.play_w + 14, y))
         y += 34
-        critical = [
-            f"Cash: ${self.sim.money}",
-            f"Orders due: {len(self.sim.orders)}",
-            f"Throughput: {self.sim.ontime_rate:0.1f}%",
-            f"Deliveries active: {len(self.sim.deliveries)}",
-        ]
-        for row in critical:
-            self.screen.blit(self.small.render(row, True, self.palette["text"]), (self.layout.play_w + 14, y))
+        # Re-format the KPI rows only when a displayed value changes.
+        values = (
+            self._layout_version,
+            self.sim.money,
+            len(self.sim.orders),
+            round(self.sim.ontime_rate, 1),
+            len(self.sim.deliveries),
+        )
+        if self._hud_rows_cache is None or self._hud_rows_cache[0] != values:
+            _, money, orders, throughput, deliveries = values
+            critical = [
+                f"Cash: ${money}",
+                f"Orders due: {orders}",
+                f"Throughput: {throughput:0.1f}%",
+                f"Deliveries active: {deliveries}",
+            ]
+            self._hud_rows_cache = (values, [self._text(row, self.palette["text"]) for row in critical])
+        for surface in self._hud_rows_cache[1]:
+            self.screen.blit(surface, (self.layout.play_w + 14, y))
             y += 24
 
         card_y = y + 10
@@ -1426,57 +2125,93 @@ class GameUI:
         self._draw_metric_card(self.layout.play_w + 14, card_y, card_w, "Bottleneck", self.sim.bottleneck, (242, 186, 88))
         self._draw_metric_card(self.layout.play_w + 14, card_y + 64, card_w, "Hygiene", self.sim.hygiene, (101, 189, 255))
 
-        if self.active_section == "Info" and self.active_subsection == "Logs":
+        if self.active_section == "Info" and self.active_subsection in ("Logs", "Economy"):
             detail_y = card_y + 138
-            self.screen.blit(self.small.render("Verbose logs:", True, self.palette["muted"]), (self.layout.play_w + 14, detail_y))
+            heading = "Verbose logs:" if self.active_subsection == "Logs" else "Channel economy:"
+            self.screen.blit(self._text(heading, self.palette["muted"]), (self.layout.play_w + 14, detail_y))
             detail_y += 22
-            for line in self.sim.event_log[-4:]:
-                self.screen.blit(self.small.render(line, True, self.palette["muted"]), (self.layout.play_w + 14, detail_y))
-                detail_y += 21
-        if self.active_section == "Info" and self.active_subsection == "Economy":
-            detail_y = card_y + 138
-            self.screen.blit(self.small.render("Channel economy:", True, self.palette["muted"]), (self.layout.play_w + 14, detail_y))
-            detail_y += 22
-            for line in self.sim.channel_stats_rows()[:3]:
-                self.screen.blit(self.small.render(line, True, self.palette["muted"]), (self.layout.play_w + 14, detail_y))
+            for line in detail:
+                self.screen.blit(self._text(line, self.palette["muted"]), (self.layout.play_w + 14, detail_y))
                 detail_y += 21
 
-    def draw_tile(self, x: int, y: int, tile) -> None:
-        assert self.layout is not None
-        cell = int(self.layout.cell_size * self.zoom)
-        if cell <= 2:
-            return
-        px, py = self._grid_to_screen(x, y)
-        rect = pygame.Rect(
-            px + 1,
-            py + 1,
-            cell - 2,
-            cell - 2,
-        )
-        play_rect = pygame.Rect(self.layout.grid_x, self.layout.grid_y, self.layout.grid_px_w, self.layout.grid_px_h)
-        if not rect.colliderect(play_rect):
-            return
-        base = self._tile_base_color(tile.kind)
-        lift = tuple(min(255, c + 25) for c in base)
-        pygame.draw.rect(self.screen, base, rect, border_radius=10)
+        panel = pygame.Rect(self.layout.play_w, 0, self.layout.side_panel_w, self.layout.viewport_h)
+        self._sidebar_cache = self.screen.subsurface(panel.clip(self.screen.get_rect())).copy()
+        self._sidebar_cache_key = sidebar_state
+
+    def _render_tile_surface(self, kind: str, rot: int, size: int) -> Tuple[pygame.Surface, int]:
+        # Icons can overhang small cells, so pad the surface to keep them unclipped.
+        scale = self.tile_icon_scale * max(0.72, min(1.28, size / 44.0))
+        pad = max(0, int(16 * scale) + 2 - size // 2)
+        surface = pygame.Surface((size + pad * 2, size + pad * 2), pygame.SRCALPHA)
+        rect = pygame.Rect(pad, pad, size, size)
+        base = self._tile_base_color(kind)
+        lift = TILE_LIFT_COLORS[base]
+        pygame.draw.rect(surface, base, rect, border_radius=10)
         shine = pygame.Rect(rect.x + 1, rect.y + 1, rect.w - 2, rect.h // 2)
-        pygame.draw.rect(self.screen, lift, shine, border_top_left_radius=10, border_top_right_radius=10)
-        pygame.draw.rect(self.screen, (255, 255, 255), rect, width=1, border_radius=10)
-        if tile.kind != EMPTY:
-            self._draw_tile_icon(tile, rect)
+        pygame.draw.rect(surface, lift, shine, border_top_left_radius=10, border_top_right_radius=10)
+        pygame.draw.rect(surface, (255, 255, 255), rect, width=1, border_radius=10)
+        if kind != EMPTY:
+            self._draw_tile_icon(surface, kind, rot, rect)
+        return surface.convert_alpha(), pad
+
+    def _tile_blit(self, x: int, y: int, kind: str, rot: int) -> Tuple[pygame.Surface, Tuple[int, int]] | None:
+        assert self._cell_rects is not None
+        rect = self._cell_rects[y][x]
+        if rect is None:
+            return None
+        if kind not in ROTATING_KINDS:
+            rot = 0
+        key = (kind, rot)
+        cached = self._tile_cache.get(key)
+        if cached is None:
+            cached = self._render_tile_surface(kind, rot, rect.w)
+            self._tile_cache[key] = cached
+        surface, pad = cached
+        return surface, (rect.x - pad, rect.y - pad)
+
+    def draw_tile(self, x: int, y: int, kind: str, rot: int) -> None:
+        blit = self._tile_blit(x, y, kind, rot)
+        if blit is not None:
+            self.screen.blit(*blit)
 
     def draw(self) -> None:
-        assert self.layout is not None
-        cell = int(self.layout.cell_size * self.zoom)
-        self.screen.fill(self.palette["bg"])
-        self.hud_toggle_rects = []
-        self.sidebar_toggle_rect = None
-        for y in range(GRID_H):
-            for x in range(GRID_W):
-                self.draw_tile(x, y, self.sim.grid[y][x])
+        layout = self.layout
+        assert layout is not None
+        screen = self.screen
+        palette = self.palette
+        sim = self.sim
+        cell = int(layout.cell_size * self.zoom)
+        if self._cell_rects is None:
+            self._rebuild_cell_rects()
+        # The grid background, bottom panel and sidebar are opaque and tile the window;
+        # only the strips they leave uncovered need clearing.
+        covered_bottom = layout.panel_y + self.panel_h
+        if covered_bottom < layout.viewport_h:
+            screen.fill(palette["bg"], (0, covered_bottom, layout.viewport_w, layout.viewport_h - covered_bottom))
+        covered_right = layout.play_w + layout.side_panel_w
+        if covered_right < layout.viewport_w:
+            screen.fill(palette["bg"], (covered_right, 0, layout.viewport_w - covered_right, layout.viewport_h))
+        # Built tiles only change on a grid edit, so they are replayed from the board.
+        board_key = (sim, sim.grid_version)
+        if self._board is None or self._board_key is None or self._board_key[0] is not sim:
+            self._board = self._build_board()
+            self._board_key = board_key
+            self._board_lined = None
+        elif self._board_key != board_key:
+            self._patch_board()
+            self._board_key = board_key
+            self._board_lined = None
 
-        if self.pending_cells:
-            play_rect = pygame.Rect(self.layout.grid_x, self.layout.grid_y, self.layout.grid_px_w, self.layout.grid_px_h)
+        if not self.pending_cells:
+            # With no previews to slot in between, the grid lines are baked onto a copy of the board.
+            if self._board_lined is None:
+                self._board_lined = self._board.copy()
+                if self._grid_overlay is not None:
+                    self._board_lined.blit(self._grid_overlay, (layout.grid_x, layout.grid_y))
+            screen.blit(self._board_lined, (0, 0))
+        else:
+            screen.blit(self._board, (0, 0))
+            play_rect = pygame.Rect(layout.grid_x, layout.grid_y, layout.grid_px_w, layout.grid_px_h)
             for gx, gy, valid in self.pending_cells:
                 px, py = self._grid_to_screen(gx, gy)
                 overlay_rect = pygame.Rect(px + 2, py + 2, max(2, cell - 4), max(2, cell - 4))
@@ -1486,85 +2221,87 @@ class GameUI:
                 fill = (88, 196, 132, 110) if valid else (231, 92, 92, 120)
                 edge = (155, 250, 196, 180) if valid else (255, 160, 160, 180)
                 preview_surface.fill(fill)
-                self.screen.blit(preview_surface, overlay_rect.topleft)
-                pygame.draw.rect(self.screen, edge, overlay_rect, width=2, border_radius=8)
-
-        for x in range(GRID_W + 1):
-            xpos, _ = self._grid_to_screen(x, 0)
-            pygame.draw.line(
-                self.screen,
-                self.palette["grid_line"],
-                (xpos, self.layout.grid_y),
-                (xpos, self.layout.grid_y + self.grid_px_h),
-                1,
-            )
-        for y in range(GRID_H + 1):
-            _, ypos = self._grid_to_screen(0, y)
-            pygame.draw.line(
-                self.screen,
-                self.palette["grid_line"],
-                (self.layout.grid_x, ypos),
-                (self.layout.grid_x + self.grid_px_w, ypos),
-                1,
-            )
-
-        for item in self.sim.items:
-            px, py = self._grid_to_screen(item.x, item.y)
-            px += cell // 2
-            py += cell // 2
-            colors = {
-                "raw": (219, 223, 235),
-                "processed": (255, 214, 126),
-                "baked": (255, 139, 94),
-            }
-            color = colors.get(item.stage, (255, 255, 255))
-            pygame.draw.circle(self.screen, (30, 34, 45), (int(px), int(py)), max(5, cell // 4))
-            pygame.draw.circle(self.screen, color, (int(px), int(py)), max(3, cell // 6))
-
-        panel = pygame.Rect(0, self.layout.panel_y, self.layout.play_w, self.panel_h)
-        pygame.draw.rect(self.screen, self.palette["panel"], panel)
-        pygame.draw.line(self.screen, self.palette["panel_border"], panel.topleft, panel.topright, 2)
-
+                screen.blit(preview_surface, overlay_rect.topleft)
+                pygame.draw.rect(screen, edge, overlay_rect, width=2, border_radius=8)
+            if self._grid_overlay is not None:
+                screen.blit(self._grid_overlay, (layout.grid_x, layout.grid_y))
+
+        if self._item_sprites is None:
+            self._item_sprites = self._build_item_sprites(cell)
+        sprites = self._item_sprites
+        centers = self._cell_centers
+        pad = sprites[0].get_width() // 2
+        item_blits = []
+        for item in sim.items:
+            cx, cy = centers[item.y][item.x]
+            item_blits.append((sprites[item.stage_id], (cx - pad, cy - pad)))
+        item_rects: List[pygame.Rect] = screen.blits(item_blits)
+
+        panel = pygame.Rect(0, layout.panel_y, layout.play_w, self.panel_h)
         ui_rects = self._ui_rects()
-        for rect, section in ui_rects["sections"]:
-            self._draw_chip(rect, section, section == self.active_section)
-        for rect, subsection in ui_rects["subsections"]:
-            is_active = subsection == self.active_subsection
-            self._draw_chip(rect, subsection, is_active)
-            # Draw tool icon on build chips
-            if self.active_section == "Build":
-                tool_key = self.build_label_to_tool_key.get(subsection)
-                if tool_key:
-                    self._draw_build_tool_icon(rect, tool_key, is_active)
-        for rect, rotation in ui_rects["tool_rotations"]:
-            rot_value = int(rotation)
-            self._draw_rotation_chip(rect, rot_value, rot_value == self.rotation)
-        for rect, label in ui_rects.get("row_toggle", []):
-            self._draw_chip(rect, label, self.row_mode_enabled)
-        for rect, label in ui_rects.get("placement_actions", []):
-            if label == "Cancel":
-                self._draw_chip(rect, label, False, style="cancel")
-            elif label.startswith("Confirm") and self._can_confirm_pending():
-                self._draw_chip(rect, "Confirm", True, style="confirm")
-            else:
-                self._draw_chip(rect, "Confirm", False, style="confirm_blocked")
-
-        for rect, label in self._toolbar_rects():
-            active = (
-                ("Conveyor" in label and self.selected == CONVEYOR)
-                or ("Processor" in label and self.selected == PROCESSOR)
-                or ("Oven" in label and self.selected == OVEN)
-                or ("Bot Dock" in label and self.selected == BOT_DOCK)
-                or ("Assembly" in label and self.selected == ASSEMBLY_TABLE)
-                or ("Delete" in label and self.selected == EMPTY)
-            )
-            self._draw_chip(rect, label, active)
-
         toolbar_rects = self._toolbar_rects()
-        text_y = self.layout.panel_y + self.panel_h - (32 if self.touch_mode else 26)
+        # The panel only changes on input or layout changes, so its chips are
+        # rasterised once and replayed as a single blit until the key moves.
+        panel_state = (
+            self._layout_version,
+            ui_rects,
+            toolbar_rects,
+            self.active_section,
+            self.active_subsection,
+            self.selected,
+            self.rotation,
+            self.row_mode_enabled,
+            self._can_confirm_pending(),
+        )
+        if self._panel_cache is not None and self._panel_cache_key == panel_state:
+            screen.blit(self._panel_cache, panel.topleft)
+        else:
+            screen.fill(palette["panel"], panel)
+            pygame.draw.line(screen, palette["panel_border"], panel.topleft, panel.topright, 2)
+
+            # Chips are queued and drawn with one blits() call; icons drawn on top flush first.
+            chip_blits = self._chip_blits
+            batch: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+            for rect, section in ui_rects["sections"]:
+                batch += chip_blits(rect, section, section == self.active_section)
+            icons = []
+            for rect, subsection in ui_rects["subsections"]:
+                is_active = subsection == self.active_subsection
+                batch += chip_blits(rect, subsection, is_active)
+                # Draw tool icon on build chips
+                if self.active_section == "Build":
+                    tool_key = self.build_label_to_tool_key.get(subsection)
+                    if tool_key:
+                        icons.append((rect, tool_key, is_active))
+            screen.blits(batch, doreturn=False)
+            batch = []
+            for rect, tool_key, is_active in icons:
+                self._draw_build_tool_icon(rect, tool_key, is_active)
+            for rect, rotation in ui_rects["tool_rotations"]:
+                rot_value = int(rotation)
+                self._draw_rotation_chip(rect, rot_value, rot_value == self.rotation)
+            for rect, label in ui_rects.get("row_toggle", []):
+                batch += chip_blits(rect, label, self.row_mode_enabled)
+            for rect, label in ui_rects.get("placement_actions", []):
+                if label == "Cancel":
+                    batch += chip_blits(rect, label, False, style="cancel")
+                elif label.startswith("Confirm") and self._can_confirm_pending():
+                    batch += chip_blits(rect, "Confirm", True, style="confirm")
+                else:
+                    batch += chip_blits(rect, "Confirm", False, style="confirm_blocked")
+
+            tool_for = self._toolbar_tool_for
+            for rect, label in toolbar_rects:
+                batch += chip_blits(rect, label, tool_for(label) == self.selected)
+            screen.blits(batch, doreturn=False)
+            panel_area = panel.clip(screen.get_rect())
+            self._panel_cache = screen.subsurface(panel_area).copy()
+            self._panel_cache_key = panel_state
+
+        text_y = layout.panel_y + self.panel_h - (32 if self.touch_mode else 26)
         if toolbar_rects:
-            text_y = max(text_y, max(rect.bottom for rect, _ in toolbar_rects) + 8)
-            text_y = min(text_y, self.layout.panel_y + self.panel_h - (32 if self.touch_mode else 26))
+            text_y = max(text_y, self._toolbar_bottom() + 8)
+            text_y = min(text_y, layout.panel_y + self.panel_h - (32 if self.touch_mode else 26))
 
         # Placement mode hint
         if self.placement_mode != "idle":
@@ -1575,42 +2312,85 @@ class GameUI:
             }
             hint = hint_map.get(self.placement_mode, "")
             if hint:
-                hint_surface = self.small.render(hint, True, (180, 220, 255))
-                self.screen.blit(hint_surface, (10, text_y - 24))
-
-        dtext = (
-            f"Tool={self.selected.upper()} Rot={self.rotation} "
-            f"Row={'On' if self.row_mode_enabled else 'Off'} | "
-            f"Orders={len(self.sim.orders)} Cash=${self.sim.money} "
-            f"Rev=${self.sim.total_revenue}"
+                hint_surface = self._text(hint, (180, 220, 255))
+                screen.blit(hint_surface, (10, text_y - 24))
+
+        status_values = (
+            self._layout_version,
+            self.selected,
+            self.rotation,
+            self.row_mode_enabled,
+            len(sim.orders),
+            sim.money,
+            sim.total_revenue,
         )
-        self.screen.blit(self.small.render(dtext, True, (255, 236, 160)), (10, text_y))
+        if self._status_line_cache is None or self._status_line_cache[0] != status_values:
+            dtext = (
+                f"Tool={self.selected.upper()} Rot={self.rotation} "
+                f"Row={'On' if self.row_mode_enabled else 'Off'} | "
+                f"Orders={len(sim.orders)} Cash=${sim.money} "
+                f"Rev=${sim.total_revenue}"
+            )
+            self._status_line_cache = (status_values, self._text(dtext, (255, 236, 160)))
+        status_rect = screen.blit(self._status_line_cache[1], (10, text_y))
         if self.status_message and self.placement_mode == "idle":
-            self.screen.blit(self.small.render(self.status_message, True, (180, 220, 255)), (10, text_y - 24))
+            screen.blit(self._text(self.status_message, (180, 220, 255)), (10, text_y - 24))
 
         if self.context_menu_cell is not None:
             cx, cy = self.context_menu_center
-            pygame.draw.circle(self.screen, (24, 34, 48), (cx, cy), self.context_menu_radius)
-            pygame.draw.circle(self.screen, (106, 130, 170), (cx, cy), self.context_menu_radius, width=2)
-            step = (2 * math.pi) / len(self.context_menu_actions)
-            for idx, label in enumerate(self.context_menu_actions):
-                ang = idx * step
-                lx = int(cx + math.cos(ang) * (self.context_menu_radius - 22))
-                ly = int(cy + math.sin(ang) * (self.context_menu_radius - 22))
-                txt = self.small.render(label.title(), True, self.palette["text"])
-                self.screen.blit(txt, txt.get_rect(center=(lx, ly)))
+            pygame.draw.circle(screen, (24, 34, 48), (cx, cy), self.context_menu_radius)
+            pygame.draw.circle(screen, (106, 130, 170), (cx, cy), self.context_menu_radius, width=2)
+            for label, center in zip(self.context_menu_actions, self._context_menu_label_centers):
+                txt = self._text(label.title(), palette["text"])
+                screen.blit(txt, txt.get_rect(center=center))
 
         self._draw_sidebar()
-        pygame.display.flip()
+        panel_key = tuple(label for _, label in ui_rects["subsections"])
+        self._present(item_rects, status_rect, panel_key)
+
+    def _present(self, item_rects: List[pygame.Rect], status_rect: pygame.Rect, panel_key: tuple) -> None:
+        assert self.layout is not None
+        # Frames redrawn only because the sim advanced change the items, the sidebar
+        # and the status line; push just those unless input or the panel changed.
+        prev_items = self._presented_item_rects
+        self._presented_item_rects = item_rects
+        panel_changed = panel_key != self._presented_panel_key
+        self._presented_panel_key = panel_key
+        if self._dirty or panel_changed or prev_items is None:
+            pygame.display.flip()
+            return
+        dirty = prev_items + item_rects
+        dirty.append(status_rect.clip(pygame.Rect(0, 0, self.layout.play_w, self.layout.viewport_h)))
+        if self.layout.side_panel_w > 0:
+            dirty.append(pygame.Rect(self.layout.play_w, 0, self.layout.side_panel_w, self.layout.viewport_h))
+        screen_area = self.layout.viewport_w * self.layout.viewport_h
+        if sum(r.w * r.h for r in dirty) > screen_area // 2:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
 
     def run(self, max_seconds: float | None = None) -> None:
         elapsed = 0.0
+        accum = 0.0
+        # Frames with nothing to redraw drop the loop rate to save battery.
+        idle_fps = IDLE_FPS_MOBILE if self.display_mode == "mobile_fullscreen" else IDLE_FPS
+        fps = TARGET_FPS
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            dt = self.clock.tick(fps) / 1000.0
             elapsed += dt
             self.handle_input()
-            self.sim.tick(dt)
-            self.draw()
+            # Fixed-step simulation independent of render rate; drop backlog after a long stall.
+            accum = min(accum + dt, SIM_TICK_DT * MAX_SIM_STEPS_PER_FRAME)
+            while accum >= SIM_TICK_DT:
+                self.sim.tick(SIM_TICK_DT)
+                accum -= SIM_TICK_DT
+            if self._dirty or self.sim.frame_id != self._last_sim_frame:
+                self.draw()
+                self._dirty = False
+                self._last_sim_frame = self.sim.frame_id
+                fps = TARGET_FPS
+            else:
+                fps = idle_fps
             if max_seconds is not None and elapsed >= max_seconds:
                 print(f"Auto-terminated: reached --max-seconds={max_seconds:.2f}")
                 break
@@ -1621,7 +2401,6 @@ def run_headless(ticks: int, dt: float, load_save: bool) -> None:
     sim = FactorySim.load() if (load_save and SAVE_FILE.exists()) else FactorySim()
 
     # Build a mid-game-like path automatically
-    from config import BOT_DOCK, CONVEYOR, OVEN, PROCESSOR
     for x in range(2, 18):
         sim.place_tile(x, 7, CONVEYOR, 0)
     sim.place_tile(7, 7, PROCESSOR, 0)
@@ -1630,8 +2409,7 @@ def run_headless(ticks: int, dt: float, load_save: bool) -> None:
     sim.place_tile(12, 7, OVEN, 0)
     sim.place_tile(14, 7, BOT_DOCK, 0)
 
-    for _ in range(ticks):
-        sim.tick(dt)
+    sim.tick_n(ticks, dt)
 
     sim.save()
     print(
@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import tempfile
 import unittest
+from dataclasses import asdict
 from pathlib import Path
 
 from config import (
@@ -65,6 +66,11 @@ class TestEntities(unittest.TestCase):
         self.assertEqual(item.ingredient_type, "")
         self.assertEqual(item.delivery_boost, 0.0)
 
+    def test_item_stage_id_follows_stage_order(self):
+        self.assertEqual(Item(x=0, y=0).stage_id, 0)
+        self.assertEqual(Item(x=0, y=0, stage="baked").stage_id, 2)
+        self.assertEqual(Item(x=0, y=0, stage="mystery").stage_id, 3)
+
     def test_item_with_ingredient_type(self):
         item = Item(x=0, y=0, ingredient_type="flour")
         self.assertEqual(item.ingredient_type, "flour")
@@ -125,6 +131,70 @@ class TestFactorySimInit(unittest.TestCase):
         self.sim.place_tile(1, 7, CONVEYOR, 0)
         self.assertEqual(self.sim.grid[7][1].kind, SOURCE)
 
+    def test_non_empty_cells_track_placement_and_removal(self):
+        self.assertIn((1, 7), self.sim.non_empty_cells())
+        self.sim.place_tile(3, 3, CONVEYOR, 0)
+        self.assertIn((3, 3), self.sim.non_empty_cells())
+        self.sim.place_tile(3, 3, EMPTY, 0)
+        self.assertNotIn((3, 3), self.sim.non_empty_cells())
+        cells = self.sim.non_empty_cells()
+        self.assertEqual(cells, sorted(cells, key=lambda c: (c[1], c[0])))
+
+    def test_non_empty_cells_refresh_inside_batch(self):
+        self.sim.non_empty_cells()
+        self.sim.begin_batch()
+        self.sim.place_tile(3, 3, CONVEYOR, 0)
+        self.assertIn((3, 3), self.sim.non_empty_cells())
+        self.sim.end_batch()
+
+    def test_bot_dock_count_follows_placement(self):
+        self.assertEqual(self.sim._bot_dock_count(), 1)
+        self.sim.tech_tree["bots"] = True
+        self.sim.money = 10_000
+        self.sim.place_tile_batch([(3, 3), (4, 3)], BOT_DOCK, 0)
+        self.assertEqual(self.sim._bot_dock_count(), 3)
+        self.sim.place_tile(3, 3, EMPTY, 0)
+        self.assertEqual(self.sim._bot_dock_count(), 2)
+
+    def test_non_empty_cells_rebuilt_from_dict(self):
+        self.sim.place_tile(3, 3, CONVEYOR, 0)
+        restored = FactorySim.from_dict(self.sim.to_dict())
+        self.assertEqual(restored.non_empty_cells(), self.sim.non_empty_cells())
+
+    def test_place_tile_batch_matches_single_placements(self):
+        cells = [(2, 3), (3, 3), (-1, 3), (1, 7), (4, 3)]
+        single = FactorySim(seed=42)
+        for x, y in cells:
+            single.place_tile(x, y, PROCESSOR, 5)
+        placed = self.sim.place_tile_batch(cells, PROCESSOR, 5)
+        self.assertEqual(placed, 3)
+        self.assertEqual(self.sim.money, single.money)
+        self.assertEqual(self.sim.non_empty_cells(), single.non_empty_cells())
+        self.assertEqual(self.sim.grid[3][2].rot, 1)
+
+    def test_batch_coalesces_frame_id_bumps(self):
+        before = self.sim.frame_id
+        self.sim.begin_batch()
+        self.sim.place_tile(3, 3, CONVEYOR, 0)
+        self.sim.place_tile(4, 3, CONVEYOR, 0)
+        self.assertEqual(self.sim.frame_id, before)
+        self.assertEqual(self.sim.grid[3][4].kind, CONVEYOR)
+        self.sim.end_batch()
+        self.assertEqual(self.sim.frame_id, before + 1)
+        self.sim.end_batch()
+        self.assertEqual(self.sim.frame_id, before + 1)
+
+    def test_grid_version_bumps_on_every_edit_inside_batch(self):
+        before = self.sim.grid_version
+        self.sim.begin_batch()
+        self.sim.place_tile(3, 3, CONVEYOR, 0)
+        self.assertEqual(self.sim.grid_version, before + 1)
+        self.sim.place_tile(4, 3, CONVEYOR, 0)
+        self.sim.end_batch()
+        self.assertEqual(self.sim.grid_version, before + 2)
+        self.sim.tick(0.1)
+        self.assertEqual(self.sim.grid_version, before + 2)
+
     def test_place_tile_out_of_bounds(self):
         self.sim.place_tile(-1, 0, CONVEYOR, 0)
         self.sim.place_tile(0, -1, CONVEYOR, 0)
@@ -162,6 +232,19 @@ class TestFactorySimTick(unittest.TestCase):
             self.sim.tick(0.1)
         self.assertGreater(len(self.sim.orders), 0)
 
+    def test_frame_id_static_when_nothing_visible_changes(self):
+        frame = self.sim.frame_id
+        self.sim.tick(0.01)
+        self.assertEqual(self.sim.frame_id, frame)
+
+    def test_frame_id_bumps_on_spawn_and_placement(self):
+        frame = self.sim.frame_id
+        self.sim.tick(ITEM_SPAWN_INTERVAL + 0.01)
+        self.assertGreater(self.sim.frame_id, frame)
+        frame = self.sim.frame_id
+        self.sim.place_tile(3, 3, CONVEYOR, 0)
+        self.assertGreater(self.sim.frame_id, frame)
+
     def test_hygiene_recovers(self):
         self.sim.hygiene = 50.0
         for _ in range(50):
@@ -462,6 +545,39 @@ class TestFactorySimSerialisation(unittest.TestCase):
         for item in sim2.items:
             self.assertIsInstance(item.ingredient_type, str)
 
+    def test_tick_n_matches_repeated_ticks(self):
+        stepped = FactorySim(seed=9)
+        for _ in range(150):
+            stepped.tick(0.1)
+        batched = FactorySim(seed=9)
+        before = batched.frame_id
+        batched.tick_n(150, 0.1)
+        self.assertEqual(batched.to_dict(), stepped.to_dict())
+        self.assertGreater(batched.frame_id, before)
+        self.assertLess(batched.frame_id, stepped.frame_id)
+
+    def test_to_dict_entities_match_asdict(self):
+        sim = FactorySim(seed=4)
+        for _ in range(200):
+            sim.tick(0.1)
+        sim.orders.append(Order("margherita", 5.0, 9.0, 12, "delivery"))
+        sim.deliveries.append(Delivery("drone", 3.0, 6.0, 3.0, "margherita", 12))
+        d = sim.to_dict()
+        self.assertTrue(sim.items)
+        self.assertEqual(d["items"], [asdict(i) for i in sim.items])
+        self.assertEqual(d["deliveries"], [asdict(x) for x in sim.deliveries])
+        self.assertEqual(d["orders"], [asdict(o) for o in sim.orders])
+
+    def test_from_dict_accepts_legacy_dict_tiles(self):
+        sim = FactorySim(seed=1)
+        d = sim.to_dict()
+        d["grid"] = [
+            [{"kind": kind, "rot": rot, "hygiene_penalty": penalty} for kind, rot, penalty in row]
+            for row in d["grid"]
+        ]
+        sim2 = FactorySim.from_dict(d)
+        self.assertEqual(sim2.grid, sim.grid)
+
     def test_from_dict_bad_grid_falls_back(self):
         sim = FactorySim(seed=1)
         d = sim.to_dict()